@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+PKG_DIR = Path("src") / "hk_public_transport_contracts"
+GENERATED_REL = "hk_public_transport_contracts/_resource_hashes.py"
+
+# Must mirror hashes.CONTRACT_RESOURCE_PATHS; the runtime ignores baked values
+# whose keys do not match.
+RESOURCE_PATHS = (
+    "schema/VERSION",
+    "schema/ddl/canonical.sql",
+    "schema/jsonschema/manifest.schema.json",
+)
+
+
+class ResourceHashesBuildHook(BuildHookInterface):
+    """
+    Bake contract resource hashes into wheels as `_resource_hashes.py`.
+
+    Editable installs are skipped so source checkouts always hash live files.
+    """
+
+    PLUGIN_NAME = "custom"
+
+    _tmp_dir: Path | None = None
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        root = Path(self.root) / PKG_DIR
+        fp = hashlib.sha256()
+        hashes: dict[str, str] = {}
+        for rel in RESOURCE_PATHS:
+            data = (root / rel).read_bytes()
+            hashes[rel] = hashlib.sha256(data).hexdigest()
+            fp.update(data)
+            fp.update(b"\n")
+
+        lines = [
+            "# Generated at wheel build time by hatch_build.py; do not edit.",
+            "from typing import Final",
+            "",
+            f"RESOURCE_HASHES: Final[dict[str, str]] = {hashes!r}",
+            f"CONTRACT_FINGERPRINT: Final[str] = {fp.hexdigest()!r}",
+            "",
+        ]
+        self._tmp_dir = Path(tempfile.mkdtemp(prefix="contracts-build-"))
+        out = self._tmp_dir / "_resource_hashes.py"
+        out.write_text("\n".join(lines), encoding="utf-8")
+        build_data["force_include"][str(out)] = GENERATED_REL
+
+    def finalize(
+        self, version: str, build_data: dict[str, Any], artifact_path: str
+    ) -> None:
+        # The generated module is already packed into the wheel by now.
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
@@ -5,6 +5,7 @@ from .hashes import (
     CONTRACT_RESOURCE_PATHS,
     compute_contract_fingerprint,
     compute_resource_hashes,
+    compute_version_bundle,
     read_bytes,
     sha256_hex,
 )
@@ -14,15 +15,17 @@ from .resources import (
     MANIFEST_SCHEMA_REL,
     SCHEMA_VERSION_REL,
     canonical_ddl,
+    canonical_ddl_bytes,
     manifest_schema,
     read_json,
+    read_mapped,
     read_text,
     schema_version_int,
     schema_version_text,
 )
 from .version import (
-    CONTRACTS_DIST_VERSION,
     ContractVersionInfo,
+    contracts_dist_version,
     get_contract_version_info,
 )
 
@@ -34,6 +37,8 @@ __all__ = [
     "read_bytes",
     "read_json",
     "canonical_ddl",
+    "canonical_ddl_bytes",
+    "read_mapped",
     "manifest_schema",
     "schema_version_text",
     "MANIFEST_SCHEMA_REL",
@@ -42,6 +47,7 @@ __all__ = [
     "validate_manifest_dict",
     "validate_manifest_json",
     "CONTRACTS_DIST_VERSION",
+    "contracts_dist_version",
     "ContractVersionInfo",
     "get_contract_version_info",
     "sha256_hex",
@@ -49,4 +55,11 @@ __all__ = [
     "CONTRACT_RESOURCE_PATHS",
     "compute_resource_hashes",
     "compute_contract_fingerprint",
+    "compute_version_bundle",
 ]
+
+
+def __getattr__(name: str) -> str:
+    if name == "CONTRACTS_DIST_VERSION":
+        return contracts_dist_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
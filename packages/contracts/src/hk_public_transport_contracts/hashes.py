@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from typing import Final
 
 from .errors import ContractsResourceError
@@ -8,6 +9,7 @@ from .resources import (
     CANONICAL_DDL_REL,
     MANIFEST_SCHEMA_REL,
     SCHEMA_VERSION_REL,
+    read_mapped,
     traversable,
 )
 
@@ -17,6 +19,14 @@ CONTRACT_RESOURCE_PATHS: Final[tuple[str, ...]] = (
     MANIFEST_SCHEMA_REL,
 )
 
+# Installed wheels ship hashes baked in by hatch_build.py; source checkouts do not.
+try:
+    from ._resource_hashes import CONTRACT_FINGERPRINT as _BAKED_FINGERPRINT
+    from ._resource_hashes import RESOURCE_HASHES as _BAKED_HASHES
+except ImportError:
+    _BAKED_FINGERPRINT = None
+    _BAKED_HASHES = {}
+
 
 def read_bytes(rel_path: str) -> bytes:
     """
@@ -32,24 +42,63 @@ def read_bytes(rel_path: str) -> bytes:
         ) from e
 
 
-def sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def _sha256_new():
+    # Prefer the OpenSSL EVP implementation (SHA-NI where the CPU supports it).
+    return hashlib.new("sha256", usedforsecurity=False)
+
+
+def sha256_hex(data: bytes | memoryview) -> str:
+    h = _sha256_new()
+    h.update(data)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _cached_hash(rel_path: str) -> str:
+    return sha256_hex(read_mapped(rel_path))
+
+
+def _baked_fingerprint(rel_paths: tuple[str, ...]) -> str | None:
+    if rel_paths == CONTRACT_RESOURCE_PATHS and _BAKED_HASHES.keys() == set(rel_paths):
+        return _BAKED_FINGERPRINT
+    return None
 
 
 def compute_resource_hashes(
     rel_paths: tuple[str, ...] = CONTRACT_RESOURCE_PATHS,
 ) -> dict[str, str]:
-    out: dict[str, str] = {}
-    for p in rel_paths:
-        out[p] = sha256_hex(read_bytes(p))
-    return out
+    return {p: _BAKED_HASHES.get(p) or _cached_hash(p) for p in rel_paths}
 
 
 def compute_contract_fingerprint(
     rel_paths: tuple[str, ...] = CONTRACT_RESOURCE_PATHS,
 ) -> str:
-    h = hashlib.sha256()
+    baked = _baked_fingerprint(rel_paths)
+    if baked is not None:
+        return baked
+
+    h = _sha256_new()
     for p in rel_paths:
-        h.update(read_bytes(p))
+        h.update(read_mapped(p))
         h.update(b"\n")
     return h.hexdigest()
+
+
+def compute_version_bundle(
+    rel_paths: tuple[str, ...] = CONTRACT_RESOURCE_PATHS,
+) -> tuple[str, dict[str, str]]:
+    """
+    Fingerprint and per-file hashes computed from a single read of each resource.
+    """
+    baked = _baked_fingerprint(rel_paths)
+    if baked is not None:
+        return baked, compute_resource_hashes(rel_paths)
+
+    h = _sha256_new()
+    per_file: dict[str, str] = {}
+    for p in rel_paths:
+        data = read_mapped(p)
+        per_file[p] = _cached_hash(p)
+        h.update(data)
+        h.update(b"\n")
+    return h.hexdigest(), per_file
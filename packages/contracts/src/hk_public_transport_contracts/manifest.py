@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from functools import lru_cache
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from jsonschema import Draft202012Validator
 
@@ -13,9 +13,30 @@ from .resources import manifest_schema
 @lru_cache(maxsize=1)
 def validator() -> Draft202012Validator:
     schema = manifest_schema()
+    Draft202012Validator.check_schema(schema)
     return Draft202012Validator(schema)
 
 
+@lru_cache(maxsize=1)
+def fast_validator() -> Callable[[Any], Any] | None:
+    """
+    Codegen'd validator from the optional `fastjsonschema` package, if installed.
+
+    Only used as an accept fast path: format assertions are disabled to match
+    Draft202012Validator's default, and any rejection is re-run through jsonschema
+    so error messages keep their usual shape.
+    """
+    try:
+        import fastjsonschema
+    except Exception:
+        return None
+
+    try:
+        return fastjsonschema.compile(manifest_schema(), use_formats=False)
+    except Exception:  # pragma: no cover
+        return None
+
+
 def format_errors(errors: Iterable[Any]) -> str:
     lines: list[str] = []
     for e in errors:
@@ -26,17 +47,68 @@ def format_errors(errors: Iterable[Any]) -> str:
     return "\n".join(lines)
 
 
+def collect_errors(obj: Any) -> str | None:
+    fv = fast_validator()
+    if fv is not None:
+        try:
+            fv(obj)
+            return None
+        except Exception:
+            pass
+
+    it = validator().iter_errors(obj)
+    first = next(it, None)
+    if first is None:
+        return None
+    errs = sorted((first, *it), key=lambda e: list(getattr(e, "path", [])))
+    return format_errors(errs)
+
+
+@lru_cache(maxsize=512)
+def _validate_cached(raw_canonical: str) -> str | None:
+    return collect_errors(json.loads(raw_canonical))
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_native(obj: Any) -> bool:
+    # Exact types: a tuple or a non-str key would survive the JSON round trip
+    # as something else and validate differently from the original object.
+    t = type(obj)
+    if t is dict:
+        return all(type(k) is str and _is_json_native(v) for k, v in obj.items())
+    if t is list:
+        return all(_is_json_native(v) for v in obj)
+    return t in _JSON_SCALARS
+
+
+def canonical_key(obj: Any) -> str | None:
+    """
+    Stable cache key for a manifest object, or None if it is not plain JSON.
+    """
+    if not _is_json_native(obj):
+        return None
+    try:
+        return json.dumps(
+            obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+    except (TypeError, ValueError):
+        return None
+
+
 def validate_manifest_dict(obj: dict[str, Any]) -> None:
     """
     Validate a manifest object against the shipped JSON schema.
     Raises ManifestValidationError with a readable message on failure.
+
+    Results are memoized on the canonical JSON form of `obj`, so re-validating
+    an identical manifest does not walk the schema again.
     """
-    v = validator()
-    errs = sorted(v.iter_errors(obj), key=lambda e: list(getattr(e, "path", [])))
-    if errs:
-        raise ManifestValidationError(
-            "Manifest validation failed:\n" + format_errors(errs)
-        )
+    key = canonical_key(obj)
+    msg = collect_errors(obj) if key is None else _validate_cached(key)
+    if msg:
+        raise ManifestValidationError("Manifest validation failed:\n" + msg)
 
 
 def validate_manifest_json(raw: str | bytes) -> dict[str, Any]:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import mmap
+from functools import lru_cache
 from importlib.resources import files
 from typing import Any, Final
 
@@ -13,10 +15,15 @@ CANONICAL_DDL_REL: Final[str] = "schema/ddl/canonical.sql"
 SCHEMA_VERSION_REL: Final[str] = "schema/VERSION"
 
 
+# Resolve the package anchor once; shipped resources never move within a process.
+_PKG_ROOT = files(PKG)
+
+
 def traversable(rel_path: str):
-    return files(PKG).joinpath(rel_path)
+    return _PKG_ROOT.joinpath(rel_path)
 
 
+@lru_cache(maxsize=8)
 def read_text(rel_path: str) -> str:
     try:
         return traversable(rel_path).read_text(encoding="utf-8")
@@ -44,11 +51,41 @@ def read_json(rel_path: str) -> dict[str, Any]:
     return obj
 
 
+@lru_cache(maxsize=8)
+def read_mapped(rel_path: str) -> memoryview:
+    """
+    Read-only view of a shipped resource, memory-mapped when it lives on disk.
+
+    Falls back to an in-memory copy for zipped installs (or empty files, which
+    cannot be mapped).
+    """
+    try:
+        with traversable(rel_path).open("rb") as f:
+            try:
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except (AttributeError, OSError, ValueError):
+                return memoryview(f.read())
+    except FileNotFoundError as e:
+        raise ContractsResourceError(f"Missing contracts resource: {rel_path}") from e
+    except Exception as e:  # pragma: no cover
+        raise ContractsResourceError(
+            f"Failed reading contracts resource: {rel_path}: {e}"
+        ) from e
+
+
+def canonical_ddl_bytes() -> memoryview:
+    """
+    Canonical SQLite DDL as UTF-8 bytes, without a decode or copy
+    """
+    return read_mapped(CANONICAL_DDL_REL)
+
+
+@lru_cache(maxsize=1)
 def canonical_ddl() -> str:
     """
     Canonical SQLite DDL
     """
-    return read_text(CANONICAL_DDL_REL)
+    return str(canonical_ddl_bytes(), "utf-8")
 
 
 def manifest_schema() -> dict[str, Any]:
@@ -58,6 +95,7 @@ def manifest_schema() -> dict[str, Any]:
     return read_json(MANIFEST_SCHEMA_REL)
 
 
+@lru_cache(maxsize=1)
 def schema_version_text() -> str:
     """
     Human-readable schema version for compatibility gate
@@ -65,6 +103,7 @@ def schema_version_text() -> str:
     return read_text(SCHEMA_VERSION_REL).strip()
 
 
+@lru_cache(maxsize=1)
 def schema_version_int() -> int:
     """
     Parse schema/VERSION as an integer compatibility gate
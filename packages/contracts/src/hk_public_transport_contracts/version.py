@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from importlib.metadata import PackageNotFoundError
-from importlib.metadata import version as dist_version
+from functools import cache
 
-from .hashes import compute_contract_fingerprint, compute_resource_hashes
+from .hashes import compute_version_bundle
 from .resources import schema_version_text
 
 
 def safe_dist_version(dist_name: str) -> str:
+    # importlib.metadata is slow to import and scan; keep it off the import path.
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as dist_version
+
     try:
         return dist_version(dist_name)
     except PackageNotFoundError:
         return "0.0.0+unknown"
 
 
-CONTRACTS_DIST_VERSION: str = safe_dist_version("hk_public_transport_contracts")
+@cache
+def contracts_dist_version() -> str:
+    return safe_dist_version("hk_public_transport_contracts")
+
+
+def __getattr__(name: str) -> str:
+    # CONTRACTS_DIST_VERSION is resolved lazily on first access (PEP 562).
+    if name == "CONTRACTS_DIST_VERSION":
+        return contracts_dist_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,9 +39,10 @@ class ContractVersionInfo:
 
 
 def get_contract_version_info() -> ContractVersionInfo:
+    fingerprint, sha256 = compute_version_bundle()
     return ContractVersionInfo(
         schema_version=schema_version_text(),
-        python_version=CONTRACTS_DIST_VERSION,
-        fingerprint=compute_contract_fingerprint(),
-        sha256=compute_resource_hashes(),
+        python_version=contracts_dist_version(),
+        fingerprint=fingerprint,
+        sha256=sha256,
     )
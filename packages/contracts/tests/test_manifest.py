@@ -7,8 +7,10 @@ import pytest
 from hk_public_transport_contracts import (
     ManifestValidationError,
     get_contract_version_info,
+    validate_manifest_dict,
     validate_manifest_json,
 )
+from hk_public_transport_contracts.manifest import _validate_cached, canonical_key
 
 FIX = Path(__file__).parent / "fixtures" / "manifest.valid.json"
 
@@ -30,3 +32,34 @@ def test_contract_version_info_present():
     info = get_contract_version_info()
     assert len(info.fingerprint) == 64
     assert "schema/VERSION" in info.sha256
+
+
+def test_repeat_validation_is_memoized():
+    obj = json.loads(FIX.read_text(encoding="utf-8"))
+    validate_manifest_dict(obj)
+    before = _validate_cached.cache_info().hits
+    validate_manifest_dict(dict(reversed(list(obj.items()))))
+    assert _validate_cached.cache_info().hits == before + 1
+
+
+def test_non_json_containers_bypass_the_memo():
+    obj = json.loads(FIX.read_text(encoding="utf-8"))
+    assert canonical_key(obj) is not None
+    obj["files"] = tuple(obj["files"])
+    assert canonical_key(obj) is None
+    assert canonical_key({1: "x"}) is None
+
+    before = _validate_cached.cache_info()
+    try:
+        validate_manifest_dict(obj)
+    except ManifestValidationError:
+        pass
+    after = _validate_cached.cache_info()
+    assert (after.hits, after.misses) == (before.hits, before.misses)
+
+
+def test_dist_version_is_resolved_lazily():
+    import hk_public_transport_contracts as contracts
+
+    info = get_contract_version_info()
+    assert contracts.CONTRACTS_DIST_VERSION == info.python_version
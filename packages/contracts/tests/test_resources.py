@@ -2,8 +2,14 @@ from __future__ import annotations
 
 from hk_public_transport_contracts import (
     canonical_ddl,
+    canonical_ddl_bytes,
+    compute_contract_fingerprint,
+    compute_resource_hashes,
+    compute_version_bundle,
     manifest_schema,
+    read_bytes,
     schema_version_int,
+    sha256_hex,
 )
 
 
@@ -20,3 +26,10 @@ def test_manifest_schema_loads():
 def test_canonical_ddl_loads():
     ddl = canonical_ddl()
     assert "CREATE TABLE" in ddl.upper()
+    assert bytes(canonical_ddl_bytes()) == read_bytes("schema/ddl/canonical.sql")
+
+
+def test_resource_hashes_match_fingerprint_inputs():
+    hashes = compute_resource_hashes()
+    assert hashes["schema/VERSION"] == sha256_hex(read_bytes("schema/VERSION"))
+    assert compute_version_bundle() == (compute_contract_fingerprint(), hashes)
@@ -7,12 +7,15 @@ from .errors import (
     PublishError,
     StageError,
     TransientError,
+    stage_error_from_exc,
 )
 from .fs import (
+    as_path,
     atomic_dir_commit,
     atomic_dir_swap,
     atomic_replace,
     atomic_write_bytes,
+    atomic_write_many,
     atomic_write_text,
     copy_or_hardlink,
     ensure_parent,
@@ -21,18 +24,24 @@ from .fs import (
     relpath_posix,
     safe_unlink,
 )
-from .hashing import sha256_bytes, sha256_file, write_sha256_sum_txt
+from .hashing import (
+    content_hash_bytes,
+    sha256_bytes,
+    sha256_file,
+    write_sha256_sum_txt,
+)
 from .json import atomic_write_json, read_json, stable_json_dumps
-from .logging import ILogger, bind, configure_logging, get_logger
+from .logging import ILogger, bind, configure_logging, get_logger, log_enabled
 from .parquet import (
     read_parquet_df,
     schema_fingerprint,
     table_meta_from_df,
+    table_meta_from_parquet,
     write_parquet_atomic,
 )
-from .paths import DataLayout
+from .paths import DataLayout, VersionedLayout
 from .provenance import RunProvenance, new_run_id
-from .time import HK_TZ, monotonic_ms, today_version, utc_now_iso
+from .time import HK_TZ, monotonic_ms, today_version, utc_iso_from_ns, utc_now_iso
 
 JsonPrimitive = str | int | float | bool | None
 JsonValue = JsonPrimitive | list["JsonValue"] | dict[str, "JsonValue"]
@@ -41,26 +50,33 @@ JsonObject = dict[str, JsonValue]
 __all__ = [
     "copy_or_hardlink",
     "atomic_write_bytes",
+    "atomic_write_many",
+    "as_path",
     "atomic_dir_commit",
     "write_sha256_sum_txt",
     "ILogger",
     "schema_fingerprint",
     "table_meta_from_df",
+    "table_meta_from_parquet",
     "atomic_write_json",
     "atomic_write_text",
     "atomic_dir_swap",
     "DataLayout",
+    "VersionedLayout",
     "fsync_file",
     "ensure_parent",
     "sha256_file",
+    "content_hash_bytes",
     "new_run_id",
     "load_settings",
     "RunProvenance",
     "configure_logging",
     "get_logger",
+    "log_enabled",
     "bind",
     "read_json",
     "today_version",
+    "utc_iso_from_ns",
     "utc_now_iso",
     "HK_TZ",
     "safe_unlink",
@@ -69,6 +85,7 @@ __all__ = [
     "monotonic_ms",
     "relpath_posix",
     "StageError",
+    "stage_error_from_exc",
     "write_parquet_atomic",
     "ParseError",
     "NormalizeError",
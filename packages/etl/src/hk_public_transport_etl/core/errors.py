@@ -19,11 +19,19 @@ class StageError:
     traceback: str
 
 
+def format_traceback(exc: BaseException) -> str:
+    """
+    Traceback text for `exc`, including chained causes and contexts.
+    """
+    tbe = traceback.TracebackException.from_exception(exc)
+    return "".join(tbe.format(chain=True))
+
+
 def stage_error_from_exc(exc: BaseException) -> StageError:
     return StageError(
         exc_type=type(exc).__name__,
         message=str(exc),
-        traceback=traceback.format_exc(),
+        traceback=format_traceback(exc),
     )
 
 
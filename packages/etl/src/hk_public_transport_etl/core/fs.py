@@ -1,18 +1,27 @@
+import errno
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Mapping
 
 from .time import utc_now_iso
 
 
+def as_path(path: os.PathLike[str] | str) -> Path:
+    return path if isinstance(path, Path) else Path(path)
+
+
 def ensure_parent(path: Path) -> None:
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    as_path(path).parent.mkdir(parents=True, exist_ok=True)
 
 
 def safe_unlink(path: os.PathLike[str] | str) -> None:
     try:
-        Path(path).unlink(missing_ok=True)
+        os.unlink(path)
+    except FileNotFoundError:
+        return
     except Exception:
         return
 
@@ -38,20 +47,61 @@ def fsync_dir(parent: Path) -> None:
             os.close(fd)
 
 
-def fsync_file(path: Path) -> None:
+# Only files at least this large are evicted after fsync: small outputs (metadata,
+# manifests) are cheap to keep and often re-read straight away.
+_DROP_CACHE_MIN_BYTES = 64 << 20
+
+
+def drop_page_cache(fd: int) -> None:
+    """
+    Hint that freshly written (and fsync'd) pages need not stay cached.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
     try:
-        with path.open("rb") as f:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        return
+
+
+def fsync_file(path: os.PathLike[str] | str) -> None:
+    try:
+        with open(path, "rb") as f:
             os.fsync(f.fileno())
     except Exception:
         return
 
 
+def _fsync_file_strict(path: os.PathLike[str] | str) -> None:
+    # Unlike fsync_file, errors propagate: callers rely on the flush to commit.
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+def fsync_many(
+    paths: Iterable[os.PathLike[str] | str], *, max_workers: int = 8
+) -> None:
+    """
+    fsync a batch of files concurrently; raises the first failure.
+
+    os.fsync releases the GIL, so wall time tracks the slowest device flush rather
+    than the sum of all of them.
+    """
+    batch = list(paths)
+    if len(batch) <= 1:
+        for p in batch:
+            _fsync_file_strict(p)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) as pool:
+        list(pool.map(_fsync_file_strict, batch))
+
+
 def atomic_write_text(
     path: Path,
     text: str,
     *,
     encoding: str = "utf-8",
-    newline: str = "\n",
+    newline: str | None = "\n",
     mode: int = 0o644,
 ) -> None:
     """
@@ -63,46 +113,11 @@ def atomic_write_text(
       - temp file written in the same directory (atomic replace works)
       - file contents are fsync()'d before replace
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Use a named temp file in the same directory.
-    fd: int | None = None
-    tmp_path: Path | None = None
-
-    try:
-        fd, tmp_name = tempfile.mkstemp(
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-            dir=str(path.parent),
-            text=True,
-        )
-        tmp_path = Path(tmp_name)
-
-        # Write, Flush, FSync process
-        with os.fdopen(fd, "w", encoding=encoding, newline=newline) as f:
-            fd = None
-            f.write(text)
-            f.flush()
-            os.fsync(f.fileno())
-
-        try:
-            os.chmod(tmp_path, mode)
-        except Exception:
-            pass
-
-        os.replace(tmp_path, path)
-
-        fsync_dir(path.parent)
-
-    finally:
-        if fd is not None:
-            try:
-                os.close(fd)
-            except Exception:
-                pass
-        if tmp_path is not None and tmp_path.exists():
-            safe_unlink(tmp_path)
+    if newline is None:
+        newline = os.linesep
+    if newline not in ("", "\n"):
+        text = text.replace("\n", newline)
+    atomic_write_bytes(path, text.encode(encoding), mode=mode)
 
 
 def atomic_dir_swap(final_dir: Path, tmp_dir: Path) -> None:
@@ -110,8 +125,8 @@ def atomic_dir_swap(final_dir: Path, tmp_dir: Path) -> None:
     Swap tmp_dir into final_dir with rollback.
     """
 
-    final_dir = Path(final_dir)
-    tmp_dir = Path(tmp_dir)
+    final_dir = as_path(final_dir)
+    tmp_dir = as_path(tmp_dir)
     parent = final_dir.parent
     parent.mkdir(parents=True, exist_ok=True)
 
@@ -173,22 +188,51 @@ def make_tmp_dir_for(final_dir: Path) -> Path:
     """
     Create a temp dir next to final_dir (same filesystem) so rename is atomic.
     """
-    final_dir = Path(final_dir)
+    final_dir = as_path(final_dir)
     final_dir.parent.mkdir(parents=True, exist_ok=True)
-    tmp = tempfile.mkdtemp(prefix=f".{final_dir.name}.tmp.", dir=str(final_dir.parent))
+    tmp = tempfile.mkdtemp(prefix=f".{final_dir.name}.tmp.", dir=final_dir.parent)
     return Path(tmp)
 
 
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """
+    In-kernel copy (reflink-aware on btrfs/XFS). Returns False when unsupported.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining > 0:
+                n = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if n == 0:
+                    # Short source (size lied, e.g. procfs): let copy2 handle it.
+                    return False
+                remaining -= n
+        return True
+    except OSError as e:
+        if e.errno in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+            return False
+        raise
+
+
 def copy_or_hardlink(src: Path, dst: Path) -> None:
     """
-    Prefer hardlink (O(1), no extra disk), fallback to copy2.
+    Prefer hardlink (O(1), no extra disk), then copy_file_range, then copy2.
     """
-    src = Path(src)
-    dst = Path(dst)
+    src = as_path(src)
+    dst = as_path(dst)
     ensure_parent(dst)
     try:
         os.link(src, dst)
+        return
     except Exception:
+        pass
+
+    if _copy_file_range(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        # shutil uses sendfile on Linux, so this is still a zero-userspace-copy path.
         shutil.copy2(src, dst)
 
 
@@ -196,53 +240,109 @@ def atomic_write_bytes(path: Path, data: bytes, *, mode: int = 0o644) -> None:
     """
     Atomically write bytes to `path` with fsync + dir fsync.
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    path = as_path(path)
+    parent = path.parent
+    parent.mkdir(parents=True, exist_ok=True)
 
     fd: int | None = None
-    tmp_path: Path | None = None
+    tmp_name: str | None = None
     try:
         fd, tmp_name = tempfile.mkstemp(
             prefix=f".{path.name}.",
             suffix=".tmp",
-            dir=str(path.parent),
+            dir=parent,
             text=False,
         )
-        tmp_path = Path(tmp_name)
 
         with os.fdopen(fd, "wb") as f:
             fd = None
             f.write(data)
             f.flush()
+            try:
+                os.fchmod(f.fileno(), mode)
+            except Exception:
+                pass
             os.fsync(f.fileno())
+            if len(data) >= _DROP_CACHE_MIN_BYTES:
+                drop_page_cache(f.fileno())
 
-        try:
-            os.chmod(tmp_path, mode)
-        except Exception:
-            pass
-
-        os.replace(tmp_path, path)
-        fsync_dir(path.parent)
+        os.replace(tmp_name, path)
+        tmp_name = None
+        fsync_dir(parent)
     finally:
         if fd is not None:
             try:
                 os.close(fd)
             except Exception:
                 pass
-        if tmp_path is not None and tmp_path.exists():
-            safe_unlink(tmp_path)
+        if tmp_name is not None and os.path.exists(tmp_name):
+            safe_unlink(tmp_name)
+
+
+def atomic_write_many(
+    items: Mapping[Path, bytes] | Iterable[tuple[Path, bytes]],
+    *,
+    mode: int = 0o644,
+) -> None:
+    """
+    Atomically write a batch of small files.
+
+    Every temp file is written first, then all of them are fsync'd in one
+    concurrent batch, replaced into place, and each distinct parent directory is
+    fsync'd once. Each file is individually atomic; the batch as a whole is not.
+    If any fsync fails, nothing is replaced and the temp files are removed.
+    """
+    pairs = list(items.items() if isinstance(items, Mapping) else items)
+    staged: list[tuple[str, Path]] = []
+    try:
+        for path, data in pairs:
+            path = as_path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+            )
+            staged.append((tmp_name, path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                try:
+                    os.fchmod(f.fileno(), mode)
+                except Exception:
+                    pass
+
+        fsync_many(tmp for tmp, _ in staged)
+        for tmp_name, path in staged:
+            os.replace(tmp_name, path)
+        staged.clear()
+        for parent in {as_path(p).parent for p, _ in pairs}:
+            fsync_dir(parent)
+    finally:
+        for tmp_name, _ in staged:
+            safe_unlink(tmp_name)
 
 
 def atomic_dir_commit(
-    *, tmp_dir: Path, final_dir: Path, overwrite: bool = False
+    *,
+    tmp_dir: Path,
+    final_dir: Path,
+    overwrite: bool = False,
+    fsync_paths: Iterable[os.PathLike[str] | str] = (),
 ) -> None:
     """
     Convenience wrapper for publish/package stages.
+
+    Files written with the atomic_write_* helpers are already durable. Pass the
+    staged members that are not (hardlinked or copied files, anything written
+    without fsync) as `fsync_paths`; they are flushed in one concurrent batch
+    before the rename publishes them. A failed flush raises, and final_dir is
+    left untouched.
     """
-    final_dir = Path(final_dir)
-    tmp_dir = Path(tmp_dir)
+    final_dir = as_path(final_dir)
+    tmp_dir = as_path(tmp_dir)
 
     if final_dir.exists() and not overwrite:
         raise FileExistsError(f"Target exists (overwrite disabled): {final_dir}")
 
+    fsync_many(fsync_paths)
+    fsync_dir(tmp_dir)
+
     atomic_dir_swap(final_dir, tmp_dir)
@@ -1,7 +1,16 @@
 import hashlib
+import io
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Mapping
+from typing import Iterable, Mapping
+
+from .fs import atomic_write_bytes
+
+# Files up to this size are hashed from a single read; larger ones stream through
+# one reusable buffer.
+SINGLE_SHOT_THRESHOLD = 8 * 1024 * 1024
+_STREAM_BUF_BYTES = 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -10,29 +19,75 @@ class FileDigest:
     bytes: int
 
 
+def _sha256_new():
+    # Prefer the OpenSSL EVP implementation (SHA-NI where the CPU supports it).
+    return hashlib.new("sha256", usedforsecurity=False)
+
+
 def sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
+    h = _sha256_new()
     h.update(b)
     return h.hexdigest()
 
 
-def sha256_file(path: Path, *, chunk_bytes: int = 1024 * 1024) -> FileDigest:
-    h = hashlib.sha256()
+def content_hash_bytes(b: bytes) -> str:
+    """
+    Internal, identity-only content hash (BLAKE2b-256, 64 hex chars).
+
+    Use for fingerprints that never leave the pipeline as a declared `sha256`;
+    BLAKE2b is faster than SHA-256 in software and ships with hashlib.
+    """
+    return hashlib.blake2b(b, digest_size=32).hexdigest()
+
+
+def sha256_fileobj(f: io.FileIO, size: int) -> FileDigest:
+    """
+    Hash an already-open unbuffered file from its current position.
+
+    `size` is the caller's fstat size; it only picks single-shot vs streaming.
+    """
+    h = _sha256_new()
     total = 0
-    with path.open("rb") as f:
-        while True:
-            b = f.read(chunk_bytes)
-            if not b:
-                break
-            h.update(b)
-            total += len(b)
+    if size <= SINGLE_SHOT_THRESHOLD:
+        data = f.readall()
+        h.update(data)
+        total = len(data)
+    else:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        mv = memoryview(bytearray(_STREAM_BUF_BYTES))
+        while n := f.readinto(mv):
+            h.update(mv[:n])
+            total += n
 
     return FileDigest(sha256=h.hexdigest(), bytes=total)
 
 
-def write_sha256_sum_txt(path: Path, entries: Mapping[str, str]) -> None:
+def sha256_file(path: Path) -> FileDigest:
+    with open(path, "rb", buffering=0) as f:
+        return sha256_fileobj(f, os.fstat(f.fileno()).st_size)
+
+
+def write_sha256_sum_txt(
+    path: Path,
+    entries: Mapping[str, str] | Iterable[tuple[str, str]],
+    *,
+    presorted: bool = False,
+) -> None:
     """
     Writes a deterministic sha256sums.txt
+
+    `entries` is a name -> sha256 mapping or an iterable of (name, sha256) pairs.
+    Pass presorted=True when the caller already yields names in sorted order.
     """
-    lines = [f"{entries[name]}  {name}\n" for name in sorted(entries.keys())]
-    path.write_text("".join(lines), encoding="utf-8")
+    pairs = entries.items() if isinstance(entries, Mapping) else entries
+    if not presorted:
+        pairs = sorted(pairs)
+
+    buf = bytearray()
+    for name, digest in pairs:
+        buf += f"{digest}  {name}\n".encode("utf-8")
+    atomic_write_bytes(path, bytes(buf))
@@ -2,16 +2,32 @@ import json
 from pathlib import Path
 from typing import Any
 
-from .fs import atomic_write_text
+import orjson
+
+from .fs import atomic_write_bytes, atomic_write_text
+
+_OPT_STABLE = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
 
 
 def atomic_write_json(path: Path, obj: Any, *, indent: int = 2) -> None:
+    if indent == 2:
+        atomic_write_bytes(
+            path,
+            orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_APPEND_NEWLINE,
+            ),
+        )
+        return
     atomic_write_text(path, json.dumps(obj, ensure_ascii=False, indent=indent) + "\n")
 
 
-def read_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+def read_json(path: Path | str) -> dict[str, Any]:
+    # Unbuffered read straight into orjson (bytes in, no decode step).
+    with open(path, "rb", buffering=0) as f:
+        return orjson.loads(f.readall())
 
 
 def stable_json_dumps(obj: Any, *, indent: int | None = 2) -> str:
@@ -20,9 +36,13 @@ def stable_json_dumps(obj: Any, *, indent: int | None = 2) -> str:
       - sort_keys=True
       - ensure_ascii=False (keep CJK readable)
       - stable separators when indent is None
+
+    orjson covers the compact and 2-space forms; other indents use stdlib json.
     """
     if indent is None:
-        return json.dumps(
-            obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        return orjson.dumps(obj, option=_OPT_STABLE).decode("utf-8")
+    if indent == 2:
+        return orjson.dumps(obj, option=_OPT_STABLE | orjson.OPT_INDENT_2).decode(
+            "utf-8"
         )
     return json.dumps(obj, sort_keys=True, ensure_ascii=False, indent=indent)
@@ -2,15 +2,14 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 import structlog
-from rich.logging import RichHandler
 from structlog.contextvars import bind_contextvars, clear_contextvars, merge_contextvars
 
 _CONFIGURED = False
 
-from typing import Any, Protocol, runtime_checkable
+_TIMESTAMPER = structlog.processors.TimeStamper(fmt="iso", utc=True)
 
 
 @runtime_checkable
@@ -32,8 +31,12 @@ def configure_logging(*, level: str = "INFO", fmt: str = "console") -> None:
     root.handlers.clear()
     root.setLevel(level.upper())
 
-    if fmt == "console":
-        handler = RichHandler(
+    renderer: Any
+    if fmt in ("console", "rich"):
+        # Rich is only needed for console output; keep it off the import path.
+        from rich.logging import RichHandler
+
+        handler: logging.Handler = RichHandler(
             rich_tracebacks=True,
             markup=False,
             show_time=False,
@@ -41,26 +44,20 @@ def configure_logging(*, level: str = "INFO", fmt: str = "console") -> None:
             log_time_format="%H:%M:%S",
             console=None,
         )
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        processors: list[Any] = [
-            merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.KeyValueRenderer(sort_keys=True),
-        ]
+        renderer = structlog.processors.KeyValueRenderer(sort_keys=True)
     else:
         handler = logging.StreamHandler(stream=sys.stdout)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        processors = [
-            merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ]
+        renderer = structlog.processors.JSONRenderer()
+
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    processors: list[Any] = [
+        merge_contextvars,
+        structlog.processors.add_log_level,
+        _TIMESTAMPER,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        renderer,
+    ]
 
     handler.setLevel(level.upper())
     root.addHandler(handler)
@@ -76,6 +73,18 @@ def configure_logging(*, level: str = "INFO", fmt: str = "console") -> None:
     _CONFIGURED = True
 
 
+def log_enabled(logger: Any, level: int) -> bool:
+    """
+    True if `logger` would emit at `level` (structlog filtering or stdlib logger).
+
+    Lets callers skip building expensive log fields; unknown loggers count as on.
+    """
+    check = getattr(logger, "is_enabled_for", None) or getattr(
+        logger, "isEnabledFor", None
+    )
+    return True if check is None else bool(check(level))
+
+
 def get_logger(name: str = "hk_public_transport") -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
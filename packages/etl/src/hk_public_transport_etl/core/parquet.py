@@ -1,26 +1,28 @@
 from __future__ import annotations
 
-import hashlib
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Literal, Union
 
 import polars as pl
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-from .fs import fsync_dir, fsync_file, safe_unlink
-from .hashing import sha256_file
+from .fs import as_path, fsync_dir, fsync_file, safe_unlink
+from .hashing import content_hash_bytes, sha256_file
 from .json import stable_json_dumps
 
 
+@lru_cache(maxsize=256)
 def schema_fingerprint(schema: pa.Schema) -> str:
+    # pa.Schema is immutable and hashable; equal schemas share one fingerprint.
     rep: list[dict[str, Any]] = []
     for f in schema:
         rep.append({"name": f.name, "type": str(f.type), "nullable": bool(f.nullable)})
     b = stable_json_dumps(rep, indent=None).encode("utf-8")
-    return hashlib.sha256(b).hexdigest()
+    return content_hash_bytes(b)
 
 
 def read_parquet_df(path: Path) -> pl.DataFrame:
@@ -31,6 +33,11 @@ ParquetWritable = Union[
     "pa.Table", "pa.RecordBatch", "pa.RecordBatchReader", "pl.DataFrame"
 ]
 
+# none: no fsync; data: fsync the file; full: fsync the file and its directory.
+Durability = Literal["none", "data", "full"]
+
+_DATA_PAGE_BYTES = 1 << 20
+
 
 def _to_arrow_table(obj: ParquetWritable) -> pa.Table:
     """
@@ -56,6 +63,8 @@ def write_parquet_atomic(
     table: ParquetWritable,
     out_path: Path,
     compression: str = "zstd",
+    *,
+    durability: Durability = "full",
 ) -> None:
     """
     Atomic Parquet write:
@@ -63,38 +72,49 @@ def write_parquet_atomic(
     Flow:
         1. Temporary file in same directory
         2. Perform `pq.write_table`
-        3. fsync
+        3. fsync (durability "data" or "full")
         4. `os.replace`
-        5. fsync(dir)
+        5. fsync(dir) (durability "full")
+
+    Use durability="none" for intermediates that are rebuilt on every run: the
+    replace is still atomic, it just is not guaranteed to survive a power loss.
     """
-    out_path = Path(out_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path = as_path(out_path)
+    parent = out_path.parent
+    parent.mkdir(parents=True, exist_ok=True)
 
     fd: int | None = None
-    tmp_path: Path | None = None
+    tmp_path: str | None = None
     try:
-        fd, tmp_name = tempfile.mkstemp(
+        fd, tmp_path = tempfile.mkstemp(
             prefix=f".{out_path.name}.",
             suffix=".tmp",
-            dir=str(out_path.parent),
+            dir=parent,
         )
         os.close(fd)
         fd = None
-        tmp_path = Path(tmp_name)
 
         table = _to_arrow_table(table)
-        pq.write_table(table, tmp_path, compression=compression)
+        pq.write_table(
+            table,
+            tmp_path,
+            compression=compression,
+            use_dictionary=True,
+            data_page_size=_DATA_PAGE_BYTES,
+        )
 
-        fsync_file(tmp_path)
+        if durability != "none":
+            fsync_file(tmp_path)
         os.replace(tmp_path, out_path)
-        fsync_dir(out_path.parent)
+        if durability == "full":
+            fsync_dir(parent)
     finally:
         if fd is not None:
             try:
                 os.close(fd)
             except Exception:
                 pass
-        if tmp_path is not None and tmp_path.exists():
+        if tmp_path is not None and os.path.exists(tmp_path):
             safe_unlink(tmp_path)
 
 
@@ -109,3 +129,25 @@ def table_meta_from_df(path: Path, df: pl.DataFrame) -> dict[str, Any]:
         "schema_hash": schema_fingerprint(schema),
         "columns": list(df.columns),
     }
+
+
+def table_meta_from_parquet(path: Path) -> dict[str, Any]:
+    """
+    Same shape as `table_meta_from_df`, built from the parquet footer only.
+
+    The schema goes through an empty polars frame so the arrow types (and hence
+    `schema_hash`) match what `pl.read_parquet(path).to_arrow()` would report.
+    """
+    digest = sha256_file(path)
+    lf = pl.scan_parquet(path)
+    pl_schema = lf.collect_schema()
+    row_count = lf.select(pl.len()).collect().item()
+    schema = pl.DataFrame(schema=pl_schema).to_arrow().schema
+    return {
+        "relpath": path.as_posix(),
+        "row_count": int(row_count),
+        "sha256": digest.sha256,
+        "bytes": int(digest.bytes),
+        "schema_hash": schema_fingerprint(schema),
+        "columns": list(pl_schema.names()),
+    }
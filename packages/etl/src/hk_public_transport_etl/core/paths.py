@@ -1,9 +1,44 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
+@dataclass(frozen=True, slots=True)
+class VersionedLayout:
+    """
+    Pre-built per-(source_id, version) directories of a DataLayout.
+    """
+
+    raw: Path
+    staged: Path
+    normalized: Path
+    validated: Path
+    out: Path
+    published: Path
+    normalized_tables: Path
+    normalized_mappings: Path
+    normalized_unresolved: Path
+
+
+@lru_cache(maxsize=256)
+def _versioned_layout(root: Path, source_id: str, version: str) -> VersionedLayout:
+    normalized = root / "normalized" / source_id / version
+    return VersionedLayout(
+        raw=root / "raw" / source_id / version,
+        staged=root / "staged" / source_id / version,
+        normalized=normalized,
+        validated=root / "validated" / source_id / version,
+        out=root / "out" / source_id / version,
+        published=root / "published" / source_id / version,
+        normalized_tables=normalized / "tables",
+        normalized_mappings=normalized / "mappings",
+        normalized_unresolved=normalized / "unresolved",
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class DataLayout:
     """
@@ -37,8 +72,14 @@ class DataLayout:
     def published_root(self) -> Path:
         return self.root / "published"
 
+    def for_version(self, source_id: str, version: str) -> VersionedLayout:
+        """
+        All per-version directories, built once and cached per (root, id, version).
+        """
+        return _versioned_layout(self.root, source_id, version)
+
     def raw(self, source_id: str, version: str) -> Path:
-        return self.raw_root() / source_id / version
+        return self.for_version(source_id, version).raw
 
     def raw_artifacts(self, source_id: str, version: str) -> Path:
         return self.raw(source_id, version) / "artifacts"
@@ -47,19 +88,19 @@ class DataLayout:
         return self.raw(source_id, version) / "raw_metadata.json"
 
     def staged(self, source_id: str, version: str) -> Path:
-        return self.staged_root() / source_id / version
+        return self.for_version(source_id, version).staged
 
     def normalized(self, source_id: str, version: str) -> Path:
-        return self.normalized_root() / source_id / version
+        return self.for_version(source_id, version).normalized
 
     def validated(self, source_id: str, version: str) -> Path:
-        return self.validated_root() / source_id / version
+        return self.for_version(source_id, version).validated
 
     def out(self, source_id: str, version: str) -> Path:
-        return self.out_root() / source_id / version
+        return self.for_version(source_id, version).out
 
     def published(self, source_id: str, version: str) -> Path:
-        return self.published_root() / source_id / version
+        return self.for_version(source_id, version).published
 
     def parsed_metadata_json(self, source_id: str, version: str) -> Path:
         return self.staged(source_id, version) / "parsed_metadata.json"
@@ -80,24 +121,28 @@ class DataLayout:
         return self.out(source_id, version) / "manifest.json"
 
     def normalized_tables(self, source_id: str, version: str) -> Path:
-        return self.normalized(source_id, version) / "tables"
+        return self.for_version(source_id, version).normalized_tables
 
     def normalized_mappings(self, source_id: str, version: str) -> Path:
-        return self.normalized(source_id, version) / "mappings"
+        return self.for_version(source_id, version).normalized_mappings
 
     def normalized_unresolved(self, source_id: str, version: str) -> Path:
-        return self.normalized(source_id, version) / "unresolved"
+        return self.for_version(source_id, version).normalized_unresolved
 
     def ensure_dirs(self, source_id: str, version: str) -> None:
+        """
+        Create every per-version directory.
+        """
+        v = self.for_version(source_id, version)
+        # Leaves only: makedirs creates the parents (including v.normalized).
         for p in (
-            self.raw(source_id, version),
-            self.staged(source_id, version),
-            self.normalized(source_id, version),
-            self.validated(source_id, version),
-            self.out(source_id, version),
-            self.published(source_id, version),
-            self.normalized_tables(source_id, version),
-            self.normalized_mappings(source_id, version),
-            self.normalized_unresolved(source_id, version),
+            v.raw,
+            v.staged,
+            v.validated,
+            v.out,
+            v.published,
+            v.normalized_tables,
+            v.normalized_mappings,
+            v.normalized_unresolved,
         ):
-            p.mkdir(parents=True, exist_ok=True)
+            os.makedirs(p, exist_ok=True)
@@ -2,17 +2,34 @@ from __future__ import annotations
 
 import os
 import platform
+import time
 import uuid
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Optional
 
-from .time import monotonic_ms
-
 
 def new_run_id() -> str:
     return uuid.uuid4().hex
 
 
+# Host facts cannot change within a process; look them up once, on first use.
+# The pid is deliberately not cached so forked workers report their own.
+@cache
+def _hostname() -> str:
+    return platform.node()
+
+
+@cache
+def _python_version() -> str:
+    return platform.python_version()
+
+
+@cache
+def _platform() -> str:
+    return platform.platform()
+
+
 @dataclass(frozen=True, slots=True)
 class RunProvenance:
     """
@@ -21,10 +38,10 @@ class RunProvenance:
 
     run_id: str
     started_at_utc: str
-    hostname: str = field(default_factory=platform.node)
+    hostname: str = field(default_factory=_hostname)
     pid: int = field(default_factory=os.getpid)
-    python: str = field(default_factory=lambda: platform.python_version())
-    platform: str = field(default_factory=lambda: platform.platform())
+    python: str = field(default_factory=_python_version)
+    platform: str = field(default_factory=_platform)
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,13 +59,19 @@ class Timer:
       duration = t.duration_ms
     """
 
-    _t0_ms: int = field(default_factory=monotonic_ms, init=False)
-    duration_ms: Optional[int] = field(default=None, init=False)
+    _t0_ns: int = field(default_factory=time.monotonic_ns, init=False)
+    duration_ns: Optional[int] = field(default=None, init=False)
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if self.duration_ns is None:
+            return None
+        return self.duration_ns // 1_000_000
 
     def __enter__(self) -> "Timer":
-        self._t0_ms = monotonic_ms()
-        self.duration_ms = None
+        self._t0_ns = time.monotonic_ns()
+        self.duration_ns = None
         return self
 
     def __exit__(self, exc_type=None, exc=None, tb=None) -> None:
-        self.duration_ms = monotonic_ms() - self._t0_ms
+        self.duration_ns = time.monotonic_ns() - self._t0_ns
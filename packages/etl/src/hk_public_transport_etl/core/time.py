@@ -1,5 +1,5 @@
 import time
-from datetime import datetime, timezone
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
 HK_TZ = ZoneInfo("Asia/Hong_Kong")
@@ -10,8 +10,25 @@ def today_version() -> str:
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    """
+    Current UTC time as `YYYY-MM-DDTHH:MM:SS.ffffffZ`.
+
+    Built from time_ns/gmtime directly; this runs once per emitted event.
+    """
+    return utc_iso_from_ns(time.time_ns())
+
+
+def utc_iso_from_ns(ns: int) -> str:
+    """
+    Format a `time.time_ns()` value like utc_now_iso().
+    """
+    s, rem = divmod(ns, 1_000_000_000)
+    tm = time.gmtime(s)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}T"
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{rem // 1_000:06d}Z"
+    )
 
 
 def monotonic_ms() -> int:
-    return int(time.monotonic() * 1000)
+    return time.monotonic_ns() // 1_000_000
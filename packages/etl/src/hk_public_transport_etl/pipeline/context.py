@@ -1,10 +1,13 @@
+import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from hk_public_transport_etl.core import ILogger, sha256_file
+from hk_public_transport_etl.core import ILogger, as_path, log_enabled
+from hk_public_transport_etl.core.hashing import FileDigest, sha256_fileobj
 
-from .events import EventSink, EventType
+from .events import EventSink, EventType, event_wire
 from .types import ArtifactRef
 
 
@@ -23,6 +26,13 @@ class RunContext:
     # optional free-form metadata
     meta: dict[str, Any] = field(default_factory=dict)
 
+    # (path, inode, mtime_ns, ctime_ns, size) -> digest, so re-recording an unchanged
+    # file skips the hash. The inode catches atomic replaces (a new file every time)
+    # that land within the filesystem's timestamp granularity.
+    _digest_cache: dict[tuple[str, int, int, int, int], FileDigest] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def stage_logger(self, stage: str) -> ILogger:
         """
         Return a logger suitable for this stage.
@@ -34,7 +44,9 @@ class RunContext:
 
     def emit(self, event: EventType | str, **kw: object) -> None:
         # Keep event chatter at debug level to leave console logs readable.
-        event_value = event.value if isinstance(event, EventType) else str(event)
+        if not log_enabled(self.logger, logging.DEBUG):
+            return
+        event_value = event_wire(event)
         self.logger.debug(event_value, event_type=event_value, **kw)
 
     # Convenience helpers that standardize artifact emission
@@ -46,12 +58,21 @@ class RunContext:
         content_type: str | None = None,
         rel_to: Path | None = None,
     ) -> ArtifactRef:
-        p = Path(path)
-        size = p.stat().st_size
-        digest = sha256_file(p)
+        p = as_path(path)
+        # One open serves both the cache key (fstat) and, on a miss, the hash.
+        with open(p, "rb", buffering=0) as f:
+            st = os.fstat(f.fileno())
+            key = (str(p), st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+            digest = self._digest_cache.get(key)
+            if digest is None:
+                digest = sha256_fileobj(f, st.st_size)
+                self._digest_cache[key] = digest
         rel = str(p if rel_to is None else p.relative_to(rel_to))
         art = ArtifactRef(
-            path=rel, bytes=size, sha256=digest.sha256, content_type=content_type
+            path=rel,
+            bytes=digest.bytes,
+            sha256=digest.sha256,
+            content_type=content_type,
         )
         self.emit(
             EventType.ARTIFACT_WRITTEN,
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import json
+import atexit
 import os
 import socket
 import threading
-from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
-from hk_public_transport_etl.core import utc_now_iso
+import orjson
+from hk_public_transport_etl.core import as_path, utc_now_iso
 
 from .types import Event
 
@@ -54,11 +54,68 @@ class EventType(str, Enum):
     PUBLISH_FINISH = "publish.finish"
 
 
+# EventType member -> wire string. EventType is a str enum, so plain strings equal to
+# a member's value hit the same entry.
+_WIRE: dict[EventType | str, str] = {e: e.value for e in EventType}
+
+
+def event_wire(event_type: EventType | str) -> str:
+    return _WIRE.get(event_type) or str(event_type)
+
+
+_DATA_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+
+# Pre-encoded JSON strings for every known event type.
+_TYPE_JSON: dict[str, bytes] = {e.value: orjson.dumps(e.value) for e in EventType}
+
+
+def _encode_event(event: Event) -> bytes:
+    """
+    One JSONL line for `event`, with the fixed envelope laid out by hand.
+
+    Only the scalar fields and the nested `data` dict go through orjson; the key
+    order matches the previous dict-based encoding.
+    """
+    t = _TYPE_JSON.get(event.type) or orjson.dumps(event.type)
+    stage = b"null" if event.stage is None else orjson.dumps(event.stage)
+    return b"".join(
+        (
+            b'{"type":',
+            t,
+            b',"ts_utc":',
+            orjson.dumps(event.ts_utc),
+            b',"run_id":',
+            orjson.dumps(event.run_id),
+            b',"stage":',
+            stage,
+            b',"data":',
+            (
+                event.data_json
+                if event.data_json is not None
+                else orjson.dumps(event.data, option=_DATA_OPTS)
+            ),
+            b"}\n",
+        )
+    )
+
+
 class EventSink:
-    def __init__(self, path: Path) -> None:
-        self.path = Path(path)
+    """
+    Append-only JSONL event writer.
+
+    Keeps one file handle open for the lifetime of the sink; `flush_every` > 1
+    batches that many events per flush (close() always flushes). Emitting after
+    close() raises ValueError.
+    """
+
+    def __init__(self, path: Path, *, flush_every: int = 1) -> None:
+        self.path = as_path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._flush_every = max(1, int(flush_every))
+        self._pending = 0
+        self._fh = self.path.open("ab", buffering=1 << 16)
+        atexit.register(self.close)
 
         self.emit(
             Event(
@@ -74,14 +131,23 @@ class EventSink:
         )
 
     def emit(self, event: Event) -> None:
-        line = json.dumps(asdict(event), ensure_ascii=False)
+        line = _encode_event(event)
         with self._lock:
-            with self.path.open("a", encoding="utf-8") as f:
-                f.write(line)
-                f.write("\n")
+            if self._fh.closed:
+                raise ValueError(f"emit on closed EventSink: {self.path}")
+            self._fh.write(line)
+            self._pending += 1
+            if self._pending >= self._flush_every:
+                self._fh.flush()
+                self._pending = 0
 
     def close(self) -> None:
-        return
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.flush()
+            self._fh.close()
+        atexit.unregister(self.close)
 
 
 def make_event(
@@ -91,13 +157,14 @@ def make_event(
     stage: Optional[str] = None,
     **data: Any,
 ) -> Event:
-    type_value = (
-        event_type.value if isinstance(event_type, EventType) else str(event_type)
-    )
+    """
+    Build an Event, encoding `data` once up front so emit() only splices bytes.
+    """
     return Event(
-        type=type_value,
+        type=event_wire(event_type),
         ts_utc=utc_now_iso(),
         run_id=run_id,
         stage=stage,
-        data=dict(data),
+        data=data,
+        data_json=orjson.dumps(data, option=_DATA_OPTS) if data else None,
     )
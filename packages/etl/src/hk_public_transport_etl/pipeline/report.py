@@ -5,6 +5,8 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+from hk_public_transport_etl.core import as_path
+
 from .stage import StageResult
 
 
@@ -25,7 +27,7 @@ class RunReport:
         return d
 
     def write_json(self, path: Path) -> None:
-        path = Path(path)
+        path = as_path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(
             json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-import traceback
+import logging
+import time
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Callable, Optional, Protocol
 
-from hk_public_transport_etl.core import StageError, monotonic_ms, utc_now_iso
+from hk_public_transport_etl.core import (
+    ILogger,
+    StageError,
+    log_enabled,
+    stage_error_from_exc,
+    utc_iso_from_ns,
+)
 
 from .context import RunContext
 from .events import EventType
@@ -18,6 +26,11 @@ def format_duration_ms(ms: int) -> str:
     return f"{ms / 1000:.2f} s"
 
 
+def _elapsed_ms(start_ns: int, end_ns: int) -> int:
+    # Both ends come from time.monotonic_ns(), so wall-clock steps cannot skew this.
+    return (end_ns - start_ns) // 1_000_000
+
+
 @dataclass(slots=True)
 class FunctionStage:
     """
@@ -41,8 +54,9 @@ class StageResult:
 
     outputs: dict[str, Any] = field(default_factory=dict)
     metrics: dict[str, Any] = field(default_factory=dict)
-    warnings: list[str] = field(default_factory=list)
-    artifacts: list[ArtifactRef] = field(default_factory=list)
+    # Tuples: the common empty case shares the () singleton instead of a new list.
+    warnings: tuple[str, ...] = ()
+    artifacts: tuple[ArtifactRef, ...] = ()
     error: Optional[StageError] = None
 
 
@@ -65,16 +79,28 @@ def run_stage(
     stage_id = stage.stage_id
     log = ctx.stage_logger(stage_id)
 
-    t0 = monotonic_ms()
-    started_at = utc_now_iso()
+    # Wall clock for the reported timestamps, monotonic clock for the duration.
+    started_at = utc_iso_from_ns(time.time_ns())
+    t0_ns = time.monotonic_ns()
     position = f"{index}/{total}" if index is not None and total is not None else None
 
-    ctx.emit(EventType.STAGE_START, stage=stage_id)
-    log.info("Stage starting", position=position, started_at=started_at)
+    # Resolved once; the success-path fields below are only built when INFO is on.
+    info_on = log_enabled(log, logging.INFO)
 
-    warnings: list[str] = []
-    artifacts: list[ArtifactRef] = []
-    metrics: dict[str, Any] = {}
+    ctx.emit(EventType.STAGE_START, stage=stage_id)
+    if info_on:
+        log.info("Stage starting", position=position, started_at=started_at)
+
+    finalize = partial(
+        _finalize,
+        ctx,
+        log,
+        stage_id=stage_id,
+        position=position,
+        t0_ns=t0_ns,
+        started_at=started_at,
+        info_on=info_on,
+    )
 
     try:
         out = stage.run(ctx) or {}
@@ -83,96 +109,96 @@ def run_stage(
                 f"Stage {stage_id} returned {type(out).__name__}, expected dict or None"
             )
 
-        if "_warnings" in out:
-            w = out.pop("_warnings")
-            if isinstance(w, list):
-                warnings.extend(str(x) for x in w)
+        # pop with a default: one lookup per reserved key, present or not.
+        w = out.pop("_warnings", None)
+        m = out.pop("_metrics", None)
+        a = out.pop("_artifacts", None)
+    except Exception as e:
+        # Finalize inside the handler so log.exception still sees the traceback.
+        return finalize(exc=e)
 
-        if "_metrics" in out:
-            m = out.pop("_metrics")
-            if isinstance(m, dict):
-                metrics.update(m)
+    return finalize(
+        out=out,
+        # The stage hands the metrics dict over; no need to copy it.
+        metrics=m if isinstance(m, dict) else {},
+        warnings=tuple(str(x) for x in w) if isinstance(w, list) else (),
+        artifacts=tuple(a) if isinstance(a, list) else (),
+    )
 
-        if "_artifacts" in out:
-            a = out.pop("_artifacts")
-            if isinstance(a, list):
-                artifacts.extend(a)
 
-        status = "success"
-        err = None
+def _finalize(
+    ctx: RunContext,
+    log: ILogger,
+    *,
+    stage_id: str,
+    position: str | None,
+    t0_ns: int,
+    started_at: str,
+    info_on: bool,
+    out: dict[str, Any] | None = None,
+    metrics: dict[str, Any] | None = None,
+    warnings: tuple[str, ...] = (),
+    artifacts: tuple[ArtifactRef, ...] = (),
+    exc: Exception | None = None,
+) -> StageResult:
+    """
+    Shared tail of run_stage: closing events, summary log and the StageResult.
+    """
+    error = stage_error_from_exc(exc) if exc is not None else None
+    metrics = metrics or {}
+    if exc is None and warnings:
+        log.warning("Stage warnings", count=len(warnings), items=list(warnings))
 
+    duration = _elapsed_ms(t0_ns, time.monotonic_ns())
+    finished_at = utc_iso_from_ns(time.time_ns())
+
+    if exc is None:
         for w in warnings:
             ctx.emit(EventType.STAGE_WARN, stage=stage_id, message=w)
-            log.warning(w)
-
         if metrics:
             ctx.emit(EventType.STAGE_METRICS, stage=stage_id, metrics=metrics)
-
-        finished_at = utc_now_iso()
-        duration = monotonic_ms() - t0
-
         ctx.emit(EventType.STAGE_SUCCESS, stage=stage_id, duration_ms=duration)
-        log_fields: dict[str, object] = {
-            "status": status,
-            "position": position,
-            "duration_ms": duration,
-            "duration": format_duration_ms(duration),
-            "warnings": len(warnings),
-            "metrics": len(metrics),
-            "outputs": sorted(out.keys()) if out else [],
-        }
-        if artifacts:
-            log_fields["artifacts"] = len(artifacts)
-
-        log.info("Stage succeeded", **log_fields)
-
-        return StageResult(
-            stage=stage_id,
-            status=status,
-            started_at_utc=started_at,
-            finished_at_utc=finished_at,
-            duration_ms=duration,
-            outputs=out,
-            metrics=metrics,
-            warnings=warnings,
-            artifacts=artifacts,
-            error=err,
-        )
-
-    except Exception as e:
-        tb = traceback.format_exc()
-        finished_at = utc_now_iso()
-        duration = monotonic_ms() - t0
-
+    else:
         ctx.emit(
             EventType.STAGE_FAILED,
             stage=stage_id,
             duration_ms=duration,
-            exc_type=type(e).__name__,
-            message=str(e),
+            exc_type=type(exc).__name__,
+            message=str(exc),
         )
-        log_fields = {
-            "status": "failed",
+
+    status = "success" if exc is None else "failed"
+    if exc is not None or info_on:
+        log_fields: dict[str, object] = {
+            "status": status,
             "position": position,
             "duration_ms": duration,
             "duration": format_duration_ms(duration),
-            "error": str(e),
         }
+        if exc is None:
+            log_fields["warnings"] = len(warnings)
+            log_fields["metrics"] = len(metrics)
+            log_fields["outputs"] = sorted(out.keys()) if out else []
+        else:
+            log_fields["error"] = str(exc)
         if artifacts:
             log_fields["artifacts"] = len(artifacts)
 
-        log.error("Stage failed", **log_fields)
-        log.exception("Stage exception")
-
-        return StageResult(
-            stage=stage_id,
-            status="failed",
-            started_at_utc=started_at,
-            finished_at_utc=finished_at,
-            duration_ms=duration,
-            outputs={},
-            metrics=metrics,
-            warnings=warnings,
-            artifacts=artifacts,
-            error=StageError(exc_type=type(e).__name__, message=str(e), traceback=tb),
-        )
+        if exc is None:
+            log.info("Stage succeeded", **log_fields)
+        else:
+            log.error("Stage failed", **log_fields)
+            log.exception("Stage exception")
+
+    return StageResult(
+        stage=stage_id,
+        status=status,
+        started_at_utc=started_at,
+        finished_at_utc=finished_at,
+        duration_ms=duration,
+        outputs=out if exc is None and out is not None else {},
+        metrics=metrics,
+        warnings=warnings,
+        artifacts=artifacts,
+        error=error,
+    )
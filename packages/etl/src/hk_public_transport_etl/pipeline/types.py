@@ -27,3 +27,5 @@ class Event:
     run_id: str
     stage: Optional[str] = None
     data: dict[str, Any] = field(default_factory=dict)
+    # Pre-encoded JSON of `data`, set by make_event; written verbatim when present.
+    data_json: Optional[bytes] = field(default=None, repr=False, compare=False)
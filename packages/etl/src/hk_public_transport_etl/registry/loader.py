@@ -1,26 +1,12 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
 
-from hk_public_transport_etl.core import read_json
-from pydantic import TypeAdapter
-
 from .models import RegistryFile, SourceSpec
 
-try:
-    import jsonschema
-except Exception:
-    jsonschema = None
-
-
-def _validate_with_jsonschema(instance: dict, schema: dict) -> None:
-    if jsonschema is None:
-        raise RuntimeError(
-            "jsonschema is required for external config validation; pip install jsonschema"
-        )
-    jsonschema.validate(instance=instance, schema=schema)
-
 
 def resolve_config_dir(explicit: Path | None = None) -> Path:
     """
@@ -31,8 +17,16 @@ def resolve_config_dir(explicit: Path | None = None) -> Path:
       2) env hk_public_transport_CONFIG_DIR
       3) ./config (when running from an etl/ working dir)
       4) discover ./config by walking upwards from this module (dev checkout)
+
+    Successful resolutions are memoized per (explicit, env, cwd).
     """
+    return _resolve_config_dir(
+        explicit, os.environ.get("hk_public_transport_CONFIG_DIR"), Path.cwd()
+    )
+
 
+@lru_cache(maxsize=8)
+def _resolve_config_dir(explicit: Path | None, env: str | None, cwd: Path) -> Path:
     def _is_config_dir(p: Path) -> bool:
         return (p / "registry.json").is_file()
 
@@ -42,7 +36,6 @@ def resolve_config_dir(explicit: Path | None = None) -> Path:
             return p
         raise RuntimeError(f"--config-dir does not look like a config directory: {p}")
 
-    env = os.environ.get("hk_public_transport_CONFIG_DIR")
     if env:
         p = Path(env).expanduser().resolve()
         if _is_config_dir(p):
@@ -51,7 +44,7 @@ def resolve_config_dir(explicit: Path | None = None) -> Path:
             f"hk_public_transport_CONFIG_DIR does not look like a config directory: {p}"
         )
 
-    for cand in (Path.cwd() / "config", Path.cwd() / "packages" / "etl" / "config"):
+    for cand in (cwd / "config", cwd / "packages" / "etl" / "config"):
         if _is_config_dir(cand):
             return cand.resolve()
 
@@ -68,27 +61,52 @@ def resolve_config_dir(explicit: Path | None = None) -> Path:
     )
 
 
-def load_registry(
-    config_dir: Path,
-    *,
-    registry_schema: dict,
-    spec_schema: dict,
-) -> dict[str, SourceSpec]:
+def _prefetch(paths: list[Path]) -> None:
+    """
+    Best-effort POSIX_FADV_WILLNEED so cold reads start before we block on them.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for p in paths:
+        try:
+            fd = os.open(p, os.O_RDONLY)
+        except OSError:
+            continue  # the real read reports it
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def load_registry(config_dir: Path) -> dict[str, SourceSpec]:
     """
     Loads config/sources/registry.json
+
+    Validation is pydantic's: the JSON Schemas from schema_for_* are generated from
+    these same models, so a second jsonschema pass could only repeat its verdict.
     """
     reg_path = config_dir / "registry.json"
-    reg_raw = read_json(reg_path)
-    _validate_with_jsonschema(reg_raw, registry_schema)
-    reg = RegistryFile.model_validate(reg_raw)
+    # model_validate_json parses the bytes in pydantic-core, with no dict in between.
+    reg = RegistryFile.model_validate_json(reg_path.read_bytes())
 
-    out: dict[str, SourceSpec] = {}
-    for rel in reg.sources:
-        spec_path = (config_dir / "sources" / rel).resolve()
-        raw = read_json(spec_path)
-        _validate_with_jsonschema(raw, spec_schema)
-        spec = SourceSpec.model_validate(raw)
+    spec_paths = [(config_dir / "sources" / rel).resolve() for rel in reg.sources]
+    _prefetch(spec_paths)
+
+    def _load_one(spec_path: Path) -> SourceSpec:
+        return SourceSpec.model_validate_json(spec_path.read_bytes())
+
+    # Spec files are independent; overlap their reads. map() keeps registry order
+    # and re-raises the first failure.
+    if len(spec_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(spec_paths))) as pool:
+            specs = list(pool.map(_load_one, spec_paths))
+    else:
+        specs = [_load_one(p) for p in spec_paths]
 
+    out: dict[str, SourceSpec] = {}
+    for spec in specs:
         if spec.id in out:
             raise ValueError(f"Duplicate SourceSpec.id across files: {spec.id}")
         out[spec.id] = spec
@@ -96,18 +114,41 @@ def load_registry(
     return out
 
 
+# JSON Schemas for editors/external tooling; not used for validation here.
+@cache
 def schema_for_source_spec() -> dict:
-    return TypeAdapter(SourceSpec).json_schema()
+    # Shared across callers; treat as read-only.
+    return SourceSpec.model_json_schema()
 
 
+@cache
 def schema_for_registry_file() -> dict:
-    return TypeAdapter(RegistryFile).json_schema()
+    return RegistryFile.model_json_schema()
+
+
+# (config_dir, stats of registry.json and sources/**/*.json) -> loaded registry
+_REGISTRY_CACHE: dict[tuple, dict[str, SourceSpec]] = {}
+
+
+def _registry_cache_key(config_dir: Path) -> tuple:
+    stats = []
+    for p in [config_dir / "registry.json", *(config_dir / "sources").rglob("*.json")]:
+        st = p.stat()
+        stats.append((str(p), st.st_mtime_ns, st.st_size))
+    return (config_dir, tuple(sorted(stats)))
 
 
 def get_source_registry(config_dir: Path | None = None) -> dict[str, SourceSpec]:
+    """
+    Load and validate the source registry, reusing the previous result while none
+    of the config files have changed. SourceSpec models are frozen, so sharing them
+    is safe; the returned dict itself is a fresh copy.
+    """
     cfg = resolve_config_dir(config_dir)
-    return load_registry(
-        cfg,
-        registry_schema=schema_for_registry_file(),
-        spec_schema=schema_for_source_spec(),
-    )
+    key = _registry_cache_key(cfg)
+    reg = _REGISTRY_CACHE.get(key)
+    if reg is None:
+        reg = load_registry(cfg)
+        _REGISTRY_CACHE.clear()
+        _REGISTRY_CACHE[key] = reg
+    return dict(reg)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from enum import StrEnum
 from functools import cached_property
 from typing import Annotated, Optional, Sequence
@@ -10,7 +11,9 @@ from pydantic import (
     ConfigDict,
     Field,
     HttpUrl,
+    PrivateAttr,
     StringConstraints,
+    field_validator,
     model_validator,
 )
 
@@ -61,12 +64,20 @@ class BaseURL(BaseModel):
     priority: int = 100
     description: Optional[str] = None
 
-    @model_validator(mode="after")
-    def _normalize_trailing_slash(self) -> "BaseURL":
-        s = str(self.url)
-        if not s.endswith("/"):
-            return self.model_copy(update={"url": HttpUrl(s + "/")})  # type: ignore[arg-type]
-        return self
+    @field_validator("url")
+    @classmethod
+    def _normalize_trailing_slash(cls, v: HttpUrl) -> HttpUrl:
+        # Field-level, so a bare base URL does not cost a whole-model copy.
+        s = str(v)
+        return v if s.endswith("/") else HttpUrl(s + "/")
+
+    @cached_property
+    def url_str(self) -> str:
+        return str(self.url)
+
+    @cached_property
+    def sort_key(self) -> tuple[int, str, str]:
+        return (self.priority, self.name, self.url_str)
 
 
 class EndpointSpec(BaseModel):
@@ -97,29 +108,54 @@ class EndpointSpec(BaseModel):
                 raise ValueError("EndpointSpec.path must not be empty")
         return self
 
-    def resolved_url_candidates(self, bases: Sequence[BaseURL]) -> list[str]:
+    @cached_property
+    def rel_path(self) -> Optional[str]:
+        return self.path.lstrip("/") if self.path is not None else None
+
+    def resolved_url_candidates(
+        self, bases: Sequence[BaseURL], *, presorted: bool = False
+    ) -> list[str]:
         """
         If url is specified, returns [url].
         otherwise joins `path` against all base_urls ordered by (priority, name, url) to be deterministic.
+        Pass presorted=True when `bases` is already in that order.
         """
         if self.url is not None:
             return [str(self.url)]
 
-        assert self.path is not None
-        rel = self.path.lstrip("/")
+        assert self.rel_path is not None
+        rel = self.rel_path
 
-        ordered = sorted(bases, key=lambda b: (b.priority, b.name, str(b.url)))
-        return [urljoin(str(b.url), rel) for b in ordered]
+        ordered = bases if presorted else sorted(bases, key=lambda b: b.sort_key)
+        return [urljoin(b.url_str, rel) for b in ordered]
 
-    def effective_filename(self) -> str:
+    @cached_property
+    def _effective_filename(self) -> str:
         if self.filename:
             return self.filename
 
         if self.url is not None:
-            return str(self.url).rstrip("/").split("/")[-1]
+            return str(self.url).rstrip("/").rsplit("/", 1)[-1]
 
         assert self.path is not None
-        return self.path.rstrip("/").split("/")[-1]
+        return self.path.rstrip("/").rsplit("/", 1)[-1]
+
+    def effective_filename(self) -> str:
+        return self._effective_filename
+
+
+@dataclass(slots=True)
+class _UrlMemo:
+    """
+    SourceSpec URL lookups, valid only for the base_urls list they were built from.
+    """
+
+    base_urls: list[BaseURL]
+    ordered: tuple[BaseURL, ...]
+    # (endpoint.url, endpoint.path) -> candidate URLs
+    candidates: dict[tuple[object, object], tuple[str, ...]] = field(
+        default_factory=dict
+    )
 
 
 class SourceSpec(BaseModel):
@@ -134,6 +170,7 @@ class SourceSpec(BaseModel):
     base_urls: list[BaseURL] = Field(default_factory=list)
     endpoints: list[EndpointSpec] = Field(..., min_length=1)
     tags: list[Tag] = Field(default_factory=list)
+    _url_memo: Optional[_UrlMemo] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def _validate(self) -> "SourceSpec":
@@ -152,6 +189,35 @@ class SourceSpec(BaseModel):
     def endpoint_map(self) -> dict[str, EndpointSpec]:
         return {e.id: e for e in self.endpoints}
 
+    def _url_state(self) -> _UrlMemo:
+        # model_copy(update=...) shares private state but swaps in a new base_urls
+        # list, so a memo built from another list is rebuilt rather than reused.
+        memo = self._url_memo
+        if memo is None or memo.base_urls is not self.base_urls:
+            memo = _UrlMemo(
+                base_urls=self.base_urls,
+                ordered=tuple(sorted(self.base_urls, key=lambda b: b.sort_key)),
+            )
+            self._url_memo = memo
+        return memo
+
+    @property
+    def ordered_base_urls(self) -> tuple[BaseURL, ...]:
+        return self._url_state().ordered
+
+    def url_candidates(self, endpoint: EndpointSpec) -> list[str]:
+        """
+        Memoized `endpoint.resolved_url_candidates` against this spec's base_urls.
+        """
+        memo = self._url_state()
+        # Keyed on what the candidates depend on, not the id, so any endpoint works.
+        key = (endpoint.url, endpoint.path)
+        hit = memo.candidates.get(key)
+        if hit is None:
+            hit = tuple(endpoint.resolved_url_candidates(memo.ordered, presorted=True))
+            memo.candidates[key] = hit
+        return list(hit)
+
 
 class RegistryFile(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
@@ -5,18 +5,31 @@ from typing import Literal
 
 JournalMode = Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
 SyncMode = Literal["OFF", "NORMAL", "FULL", "EXTRA"]
+# quick: PRAGMA quick_check (skips index/table cross-checks); full: integrity_check
+IntegrityLevel = Literal["quick", "full"]
 
 
 @dataclass(frozen=True, slots=True)
 class CommitConfig:
     cache_size_kb: int = 200_000
+    # Fewer, larger pages for the bulk load; applied before the DDL creates tables.
+    page_size_bytes: int = 32_768
+    mmap_size_bytes: int = 1 << 30
     batch_rows: int = 200_000
+    # Tables below this many rows load in input order instead of PK order.
+    # 0 keeps the PK-ordered page layout for every table.
+    pre_sort_min_rows: int = 0
+    # Parquet tables decoded ahead of the SQLite writer (0 = decode inline)
+    parquet_decode_workers: int = 1
     import_journal_mode: JournalMode = "MEMORY"
     import_synchronous: SyncMode = "OFF"
     final_journal_mode: JournalMode = "DELETE"
     final_synchronous: SyncMode = "NORMAL"
     run_analyze: bool = False
+    # Rows ANALYZE samples per index (PRAGMA analysis_limit); 0 = full scan
+    analysis_limit: int = 1000
     run_optimize: bool = False
     run_vacuum: bool = False
     enforce_single_source_per_table: bool = True
     create_headway_debug_tables: bool = True
+    integrity_level: IntegrityLevel = "quick"
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import re
+from functools import cache
 from importlib import resources
 
 _CONTRACTS_PKG = "hk_public_transport_contracts"
+_CONTRACTS_ROOT = resources.files(_CONTRACTS_PKG)
 
 
+# Both loaders read installed package resources, which only change on reinstall.
+@cache
 def load_canonical_ddl() -> str:
-    root = resources.files(_CONTRACTS_PKG)
-    matches = [p for p in root.rglob("canonical.sql") if p.is_file()]
+    matches = [p for p in _CONTRACTS_ROOT.rglob("canonical.sql") if p.is_file()]
     if not matches:
         raise FileNotFoundError(
             f"Could not find canonical.sql in {_CONTRACTS_PKG} package resources."
@@ -20,6 +23,7 @@ def load_canonical_ddl() -> str:
     return matches[0].read_text(encoding="utf-8")
 
 
+@cache
 def load_schema_version() -> int:
     # prefer python constant
     try:
@@ -30,10 +34,9 @@ def load_schema_version() -> int:
     except Exception:
         pass
 
-    root = resources.files(_CONTRACTS_PKG)
     candidates = []
     for name in ("SCHEMA_VERSION", "schema_version.txt", "VERSION"):
-        candidates.extend([p for p in root.rglob(name) if p.is_file()])
+        candidates.extend([p for p in _CONTRACTS_ROOT.rglob(name) if p.is_file()])
 
     for p in candidates:
         txt = p.read_text(encoding="utf-8")
@@ -33,7 +33,8 @@ def resolve_pattern_headways(
 
     Assumptions / invariants:
       - routes.route_id is INTERNAL
-      - upstream identity lives in map_route_source.source_route_id (string)
+      - upstream identity lives in map_route_source.source_route_id (string), with
+        its all-digit integer form precomputed as map_route_source.upstream_route_id
       - headway_frequencies.upstream_route_id is INTEGER (GTFS route_id)
       - route_patterns.route_seq corresponds to "route bound" in headway trip_id parsing
 
@@ -46,97 +47,157 @@ def resolve_pattern_headways(
     # Temporary tables used for resolution
     # We avoid window functions to reduce SQLite version assumptions.
 
-    # Normalization for numeric strings in SQLite:
-    # If purely digits: ltrim leading zeros; if result empty to "0"; cast to INTEGER
-    norm_route_id_expr = """
-    CASE
-      WHEN source_route_id GLOB '[0-9]*' AND source_route_id <> ''
-      THEN CAST(
-        CASE
-          WHEN ltrim(source_route_id, '0') = '' THEN '0'
-          ELSE ltrim(source_route_id, '0')
-        END AS INTEGER
-      )
-      ELSE NULL
-    END
+    # Only the three tables reused after the INSERT (unresolved counts, debug table)
+    # are materialized; the intermediate steps are CTEs inside their statements.
+    ru_raw_cte = f"""
+        ru_raw AS (
+          -- upstream_route_id is normalized by load_temp_map_route_source
+          SELECT route_id, upstream_route_id
+          FROM map_route_source
+          WHERE source = {sql_quote(routes_fares_source_id)}
+        )
     """
 
     conn.executescript(
         f"""
-        DROP TABLE IF EXISTS temp._ru_raw;
-        CREATE TEMP TABLE _ru_raw AS
-        SELECT
-          route_id,
-          {norm_route_id_expr} AS upstream_route_id
-        FROM map_route_source
-        WHERE source = {sql_quote(routes_fares_source_id)};
-
         DROP TABLE IF EXISTS temp._ru_ambiguous;
         CREATE TEMP TABLE _ru_ambiguous AS
+        WITH {ru_raw_cte}
         SELECT upstream_route_id
-        FROM _ru_raw
+        FROM ru_raw
         WHERE upstream_route_id IS NOT NULL
         GROUP BY upstream_route_id
         HAVING COUNT(DISTINCT route_id) > 1;
+        CREATE INDEX temp.idx_ru_ambiguous_upstream ON _ru_ambiguous(upstream_route_id);
 
+        -- Same grouping as _ru_ambiguous, keeping the unambiguous side
         DROP TABLE IF EXISTS temp._ru_unique;
         CREATE TEMP TABLE _ru_unique AS
+        WITH {ru_raw_cte}
         SELECT
           upstream_route_id,
           MIN(route_id) AS route_id
-        FROM _ru_raw
+        FROM ru_raw
         WHERE upstream_route_id IS NOT NULL
-          AND upstream_route_id NOT IN (SELECT upstream_route_id FROM _ru_ambiguous)
-        GROUP BY upstream_route_id;
+        GROUP BY upstream_route_id
+        HAVING COUNT(DISTINCT route_id) = 1;
+        CREATE UNIQUE INDEX temp.idx_ru_unique_upstream
+          ON _ru_unique(upstream_route_id, route_id);
 
-        -- Pattern stop counts (active patterns only)
-        DROP TABLE IF EXISTS temp._pat_counts;
-        CREATE TEMP TABLE _pat_counts AS
-        SELECT
-          rp.route_id,
-          rp.route_seq,
-          rp.pattern_id,
-          COUNT(ps.seq) AS stop_count
-        FROM route_patterns rp
-        JOIN pattern_stops ps ON ps.pattern_id = rp.pattern_id
-        GROUP BY rp.route_id, rp.route_seq, rp.pattern_id;
-
-        -- Max stop_count per (route_id, route_seq)
-        DROP TABLE IF EXISTS temp._pat_max;
-        CREATE TEMP TABLE _pat_max AS
-        SELECT route_id, route_seq, MAX(stop_count) AS max_stop_count
-        FROM _pat_counts
-        GROUP BY route_id, route_seq;
-
-        -- Deterministic chosen pattern per (route_id, route_seq): max stop_count, tie -> min(pattern_id)
-        DROP TABLE IF EXISTS temp._pat_best;
-        CREATE TEMP TABLE _pat_best AS
-        SELECT
-          c.route_id,
-          c.route_seq,
-          MIN(c.pattern_id) AS pattern_id
-        FROM _pat_counts c
-        JOIN _pat_max m
-          ON m.route_id = c.route_id
-         AND m.route_seq = c.route_seq
-         AND m.max_stop_count = c.stop_count
-        GROUP BY c.route_id, c.route_seq;
+        -- Clear existing resolved rows (idempotent rebuild)
+        DELETE FROM pattern_headways;
+        """
+    )
 
+    # Nothing can resolve without a unique upstream mapping or any headways (e.g. a
+    # partial rebuild without the routes/fares source): skip the pattern ranking and
+    # the INSERT. An empty _pat_upstream keeps the count/debug queries below valid.
+    resolvable = (
+        conn.execute("SELECT 1 FROM _ru_unique LIMIT 1;").fetchone() is not None
+        and conn.execute("SELECT 1 FROM headway_frequencies LIMIT 1;").fetchone()
+        is not None
+    )
+    if resolvable:
+        _insert_resolved_headways(conn)
+        inserted = conn.execute("SELECT COUNT(*) FROM pattern_headways;").fetchone()[0]
+    else:
+        conn.executescript(
+            """
+            DROP TABLE IF EXISTS temp._pat_upstream;
+            CREATE TEMP TABLE _pat_upstream (
+              upstream_route_id INTEGER,
+              route_seq INTEGER,
+              pattern_id INTEGER
+            );
+            """
+        )
+        inserted = 0
+
+    # ---- unresolved counts, in one pass over headway_frequencies.
+    # _ru_ambiguous, _ru_unique and _pat_upstream are unique on their join keys, so
+    # the LEFT JOINs never duplicate hf rows. An ambiguous upstream id also counts
+    # as a missing route (it has no _ru_unique row), as before.
+    (
+        missing_route,
+        ambiguous_route,
+        missing_route_seq,
+        missing_pattern,
+    ) = _unresolved_counts(conn)
+
+    if create_debug_tables:
+        _create_unresolved_debug_table(conn)
+
+    # Free the scratch tables now rather than at close: the bundle connection runs
+    # with temp_store = MEMORY and still has VACUUM/checks ahead. TEMP schema edits
+    # never touch the main database or its journal, so this is one cheap script.
+    conn.executescript(
+        """
+        DROP TABLE IF EXISTS temp._ru_ambiguous;
+        DROP TABLE IF EXISTS temp._ru_unique;
+        DROP TABLE IF EXISTS temp._pat_upstream;
+        """
+    )
+
+    return HeadwayResolveStats(
+        inserted_rows=int(inserted),
+        unresolved_missing_route=int(missing_route),
+        unresolved_ambiguous_route=int(ambiguous_route),
+        unresolved_missing_route_seq=int(missing_route_seq),
+        unresolved_missing_pattern=int(missing_pattern),
+    )
+
+
+def _insert_resolved_headways(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
         -- Map upstream (route_id, route_seq) -> chosen pattern_id
+        -- pat_best: deterministic chosen pattern per (route_id, route_seq): max
+        -- stop_count, tie -> min(pattern_id). One pass via SQLite's bare-column rule
+        -- (SELECT docs, 2.5): with a single max() aggregate, bare columns come from
+        -- the row holding the maximum. The key packs stop_count above -pattern_id so
+        -- it is unique per group (pattern_id is a 1-based row index, well below 2^32).
         DROP TABLE IF EXISTS temp._pat_upstream;
         CREATE TEMP TABLE _pat_upstream AS
+        WITH
+        pat_counts AS (
+          SELECT
+            rp.route_id,
+            rp.route_seq,
+            rp.pattern_id,
+            COUNT(ps.seq) AS stop_count
+          FROM route_patterns rp
+          JOIN pattern_stops ps ON ps.pattern_id = rp.pattern_id
+          GROUP BY rp.pattern_id
+        ),
+        pat_best AS (
+          SELECT
+            route_id,
+            route_seq,
+            pattern_id,
+            MAX(stop_count * 4294967296 - pattern_id) AS best_key
+          FROM pat_counts
+          GROUP BY route_id, route_seq
+        )
         SELECT
           ru.upstream_route_id,
           pb.route_seq,
           pb.pattern_id
         FROM _ru_unique ru
-        JOIN _pat_best pb
+        JOIN pat_best pb
           ON pb.route_id = ru.route_id;
+        -- Covering for the INSERT and the unresolved-count/debug probes
+        CREATE UNIQUE INDEX temp.idx_pat_upstream_key
+          ON _pat_upstream(upstream_route_id, route_seq, pattern_id);
 
-        -- Clear existing resolved rows (idempotent rebuild)
-        DELETE FROM pattern_headways;
+        -- Give the planner row counts for the temp tables before the joins below
+        ANALYZE temp;
 
-        -- Insert resolved headways (aggregate duplicates deterministically)
+        -- Insert resolved headways (aggregate duplicates deterministically).
+        -- hf is probed through its WITHOUT ROWID primary key, which already covers
+        -- every column read here, so no extra index helps; pattern_id is not
+        -- monotonic in hf key order, so the single GROUP BY b-tree stays. Its output
+        -- order equals the pattern_headways PK, and the ORDER BY pins that (at no
+        -- extra sort) so the WITHOUT ROWID inserts always append.
         INSERT INTO pattern_headways (
           pattern_id, service_id, start_time, end_time, headway_secs, sample_trip_id
         )
@@ -152,99 +213,62 @@ def resolve_pattern_headways(
           ON pu.upstream_route_id = hf.upstream_route_id
          AND pu.route_seq = hf.route_seq
         WHERE hf.route_seq IS NOT NULL
-        GROUP BY pu.pattern_id, hf.service_id, hf.start_time, hf.end_time;
-
+        GROUP BY pu.pattern_id, hf.service_id, hf.start_time, hf.end_time
+        ORDER BY pu.pattern_id, hf.service_id, hf.start_time, hf.end_time;
         """
     )
 
-    inserted = conn.execute("SELECT COUNT(*) FROM pattern_headways;").fetchone()[0]
 
-    # ---- unresolved counts
-    missing_route = conn.execute(
+def _unresolved_counts(conn: sqlite3.Connection) -> tuple[int, int, int, int]:
+    return conn.execute(
         """
-        SELECT COUNT(*)
+        SELECT
+          COALESCE(SUM(ru.route_id IS NULL), 0),
+          COALESCE(SUM(amb.upstream_route_id IS NOT NULL), 0),
+          COALESCE(SUM(hf.route_seq IS NULL), 0),
+          COALESCE(SUM(
+            ru.route_id IS NOT NULL
+            AND hf.route_seq IS NOT NULL
+            AND pu.pattern_id IS NULL
+          ), 0)
         FROM headway_frequencies hf
+        LEFT JOIN _ru_ambiguous amb ON amb.upstream_route_id = hf.upstream_route_id
         LEFT JOIN _ru_unique ru ON ru.upstream_route_id = hf.upstream_route_id
-        WHERE ru.route_id IS NULL;
+        LEFT JOIN _pat_upstream pu
+          ON pu.upstream_route_id = hf.upstream_route_id
+         AND pu.route_seq = hf.route_seq;
         """
-    ).fetchone()[0]
+    ).fetchone()
 
-    ambiguous_route = conn.execute(
-        """
-        SELECT COUNT(*)
-        FROM headway_frequencies hf
-        WHERE hf.upstream_route_id IN (SELECT upstream_route_id FROM _ru_ambiguous);
-        """
-    ).fetchone()[0]
 
-    missing_route_seq = conn.execute(
-        """
-        SELECT COUNT(*)
-        FROM headway_frequencies hf
-        WHERE hf.route_seq IS NULL;
-        """
-    ).fetchone()[0]
-
-    missing_pattern = conn.execute(
+def _create_unresolved_debug_table(conn: sqlite3.Connection) -> None:
+    conn.executescript(
         """
-        SELECT COUNT(*)
+        DROP TABLE IF EXISTS unresolved_headway_frequencies;
+        -- Materialized, not a view: it must outlive the temp tables it is built
+        -- from. One LEFT JOIN pass over the indexed temp tables replaces the
+        -- per-row IN / NOT EXISTS probes.
+        CREATE TABLE unresolved_headway_frequencies AS
+        SELECT
+          hf.*,
+          CASE
+            WHEN hf.route_seq IS NULL THEN 'missing_route_seq'
+            WHEN amb.upstream_route_id IS NOT NULL THEN 'ambiguous_upstream_route_id'
+            WHEN ru.upstream_route_id IS NULL THEN 'missing_upstream_route_id'
+            WHEN pu.upstream_route_id IS NULL THEN 'missing_pattern'
+            ELSE 'unknown'
+          END AS reason
         FROM headway_frequencies hf
-        JOIN _ru_unique ru ON ru.upstream_route_id = hf.upstream_route_id
+        LEFT JOIN _ru_ambiguous amb ON amb.upstream_route_id = hf.upstream_route_id
+        LEFT JOIN _ru_unique ru ON ru.upstream_route_id = hf.upstream_route_id
         LEFT JOIN _pat_upstream pu
           ON pu.upstream_route_id = hf.upstream_route_id
          AND pu.route_seq = hf.route_seq
-        WHERE hf.route_seq IS NOT NULL
-          AND pu.pattern_id IS NULL;
-        """
-    ).fetchone()[0]
-
-    if create_debug_tables:
-        conn.executescript(
-            """
-            DROP TABLE IF EXISTS unresolved_headway_frequencies;
-            CREATE TABLE unresolved_headway_frequencies AS
-            SELECT
-              hf.*,
-              CASE
-                WHEN hf.route_seq IS NULL THEN 'missing_route_seq'
-                WHEN hf.upstream_route_id IN (SELECT upstream_route_id FROM _ru_ambiguous) THEN 'ambiguous_upstream_route_id'
-                WHEN hf.upstream_route_id NOT IN (SELECT upstream_route_id FROM _ru_unique) THEN 'missing_upstream_route_id'
-                WHEN NOT EXISTS (
-                  SELECT 1 FROM _pat_upstream pu
-                  WHERE pu.upstream_route_id = hf.upstream_route_id AND pu.route_seq = hf.route_seq
-                ) THEN 'missing_pattern'
-                ELSE 'unknown'
-              END AS reason
-            FROM headway_frequencies hf
-            WHERE hf.upstream_route_id NOT IN (SELECT upstream_route_id FROM _ru_unique)
-               OR hf.upstream_route_id IN (SELECT upstream_route_id FROM _ru_ambiguous)
-               OR hf.route_seq IS NULL
-               OR NOT EXISTS (
-                  SELECT 1 FROM _pat_upstream pu
-                  WHERE pu.upstream_route_id = hf.upstream_route_id AND pu.route_seq = hf.route_seq
-               );
-            """
-        )
-
-    # Clean up temp tables (optional; TEMP tables die with connection anyway)
-    conn.executescript(
+        WHERE ru.upstream_route_id IS NULL
+           OR amb.upstream_route_id IS NOT NULL
+           OR hf.route_seq IS NULL
+           OR pu.upstream_route_id IS NULL;
         """
-        DROP TABLE IF EXISTS temp._ru_raw;
-        DROP TABLE IF EXISTS temp._ru_ambiguous;
-        DROP TABLE IF EXISTS temp._ru_unique;
-        DROP TABLE IF EXISTS temp._pat_counts;
-        DROP TABLE IF EXISTS temp._pat_max;
-        DROP TABLE IF EXISTS temp._pat_best;
-        DROP TABLE IF EXISTS temp._pat_upstream;
-        """
-    )
-
-    return HeadwayResolveStats(
-        inserted_rows=int(inserted),
-        unresolved_missing_route=int(missing_route),
-        unresolved_ambiguous_route=int(ambiguous_route),
-        unresolved_missing_route_seq=int(missing_route_seq),
-        unresolved_missing_pattern=int(missing_pattern),
     )
 
 
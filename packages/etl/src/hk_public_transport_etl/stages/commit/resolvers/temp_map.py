@@ -17,6 +17,23 @@ class TempMapLoadStats:
     path: Path
 
 
+def _normalized_upstream_route_id() -> pl.Expr:
+    """
+    Integer form of an all-digit source_route_id ("007" -> 7, "000" -> 0), else null.
+
+    Headway resolution joins on this against the integer GTFS route_id.
+    """
+    sid = pl.col("source_route_id")
+    digits = sid.str.strip_chars_start("0")
+    return (
+        pl.when(sid.str.contains(r"^[0-9]+$"))
+        .then(pl.when(digits == "").then(pl.lit("0")).otherwise(digits))
+        .otherwise(None)
+        .cast(pl.Int64, strict=False)
+        .alias("upstream_route_id")
+    )
+
+
 def load_temp_map_route_source(
     conn: sqlite3.Connection,
     *,
@@ -31,8 +48,6 @@ def load_temp_map_route_source(
     if not parquet_path.exists():
         raise FileNotFoundError(f"Missing mapping parquet: {parquet_path}")
 
-    df = pl.read_parquet(parquet_path)
-
     required = [
         "source",
         "mode",
@@ -42,11 +57,13 @@ def load_temp_map_route_source(
         "route_id",
         "route_key",
     ]
-    missing = [c for c in required if c not in df.columns]
+    # Check the footer schema, then read only the columns the table needs.
+    columns = list(pl.read_parquet_schema(parquet_path))
+    missing = [c for c in required if c not in columns]
     if missing:
-        raise ValueError(f"{parquet_path} missing columns: {missing}; got={df.columns}")
+        raise ValueError(f"{parquet_path} missing columns: {missing}; got={columns}")
 
-    df = df.select(required).with_columns(
+    df = pl.read_parquet(parquet_path, columns=required).with_columns(
         pl.col("source").cast(pl.Utf8),
         pl.col("mode").cast(pl.Utf8),
         pl.col("source_route_id").cast(pl.Utf8),
@@ -55,6 +72,7 @@ def load_temp_map_route_source(
         pl.col("route_id").cast(pl.Int64),
         pl.col("route_key").cast(pl.Utf8),
     )
+    df = df.with_columns(_normalized_upstream_route_id())
 
     conn.execute(f"DROP TABLE IF EXISTS temp.{table_name};")
     conn.execute(
@@ -66,20 +84,34 @@ def load_temp_map_route_source(
           source_file     TEXT,
           source_row      INTEGER,
           route_id        INTEGER,
-          route_key       TEXT
+          route_key       TEXT,
+          -- source_route_id as an integer when it is all digits, else NULL
+          upstream_route_id INTEGER
         );
         """
     )
 
-    rows = df.rows()
-    conn.executemany(
-        f"""
-        INSERT INTO {table_name} (
-          source, mode, source_route_id, source_file, source_row, route_id, route_key
-        ) VALUES (?, ?, ?, ?, ?, ?, ?);
-        """,
-        rows,
-    )
+    # Stream rows straight from the frame (no full list of tuples), in one
+    # transaction so an autocommit connection does not commit per row.
+    own_txn = not conn.in_transaction
+    if own_txn:
+        conn.execute("BEGIN;")
+    try:
+        conn.executemany(
+            f"""
+            INSERT INTO {table_name} (
+              source, mode, source_route_id, source_file, source_row, route_id, route_key,
+              upstream_route_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+            df.iter_rows(),
+        )
+    except Exception:
+        if own_txn:
+            conn.execute("ROLLBACK;")
+        raise
+    if own_txn:
+        conn.execute("COMMIT;")
 
     # Helpful indexes for resolver joins
     conn.execute(
@@ -91,7 +123,7 @@ def load_temp_map_route_source(
         f"ON {table_name}(route_id);"
     )
 
-    stats = TempMapLoadStats(table=table_name, rows=len(rows), path=parquet_path)
+    stats = TempMapLoadStats(table=table_name, rows=df.height, path=parquet_path)
     log.info(
         "Loaded TEMP mapping table",
         extra={"table": table_name, "rows": stats.rows, "path": str(parquet_path)},
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -18,6 +19,25 @@ class CommitResult:
     build_metadata_path: Path
 
 
+def _scan_parquet_tables(tables_dir: Path) -> list[Path]:
+    """
+    Sorted *.parquet files directly under tables_dir; [] if it does not exist.
+
+    One scandir replaces exists() + glob(), which lstats every child.
+    """
+    try:
+        with os.scandir(tables_dir) as it:
+            names = [
+                e.name
+                for e in it
+                if e.name.endswith(".parquet") and e.is_file(follow_symlinks=True)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    names.sort()
+    return [tables_dir / n for n in names]
+
+
 def run_commit_bundle(
     *,
     specs: list[SourceSpec],
@@ -46,11 +66,7 @@ def run_commit_bundle(
         if vr.exists():
             validation_reports[sid] = vr
 
-        tables_dir = layout.normalized_tables(sid, version)
-        if not tables_dir.exists():
-            continue
-
-        for p in sorted(tables_dir.glob("*.parquet")):
+        for p in _scan_parquet_tables(layout.normalized_tables(sid, version)):
             table = p.stem
             if cfg.enforce_single_source_per_table and table in table_inputs:
                 raise RuntimeError(
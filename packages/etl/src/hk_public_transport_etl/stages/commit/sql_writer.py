@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 import os
 import sqlite3
 import tempfile
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Iterator, Mapping
+from typing import Any, Callable, Iterable, Iterator, Mapping
 
+import orjson
 import polars as pl
 from hk_public_transport_etl.core import (
     CommitError,
@@ -57,7 +60,8 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
     bundle_id = params.bundle_id
     bundle_version = params.bundle_version
     table_inputs = params.table_inputs
-    validation_reports = params.validation_reports
+    # Hashed once here; both the meta row and build_metadata reuse the digests.
+    report_digests = _report_digests(params.validation_reports)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -89,7 +93,9 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
             raise ValueError(f"Unknown headway mode: {headway_mode}")
 
     t0 = time.perf_counter()
-    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    # The build issues many distinct small statements (PRAGMAs, per-table INSERTs,
+    # resolver/meta queries); keep all of them prepared for the connection's life.
+    conn = sqlite3.connect(tmp_path, isolation_level=None, cached_statements=512)
     try:
         _apply_import_pragmas(conn, cfg)
 
@@ -97,21 +103,47 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
         t1 = time.perf_counter()
         conn.executescript(ddl_sql)
         _set_schema_user_version(conn, schema_version)
+        shapes = _introspect_all_tables(conn)
         timings["ddl_pre_seconds"] = time.perf_counter() - t1
 
         # Bulk Insert
         t2 = time.perf_counter()
         conn.execute("BEGIN;")
         try:
-            for table_name in sorted(table_inputs.keys()):
-                if table_name == "pattern_headways":
-                    # always derived; ignore any parquet version
-                    continue
-                if table_name in drop_on_import:
-                    continue
-                df = pl.read_parquet(table_inputs[table_name])
+            load_order = [
+                t
+                for t in sorted(table_inputs.keys())
+                # pattern_headways is always derived; ignore any parquet version
+                if t != "pattern_headways" and t not in drop_on_import
+            ]
+
+            def prepare(table_name: str, df: pl.DataFrame) -> pl.DataFrame:
+                shape = shapes.get(table_name)
+                if shape is None:
+                    return df  # unknown table: _insert_table reports it
+                return _prepare_for_insert(
+                    table_name,
+                    df,
+                    shape.columns,
+                    shape.pk_cols,
+                    pre_sort_min_rows=cfg.pre_sort_min_rows,
+                )
+
+            # Projection, PK sort and cell coercion run in the decode workers, off
+            # the writer's path; the writer only streams rows into SQLite.
+            for table_name, df in _read_tables_ahead(
+                table_inputs,
+                load_order,
+                workers=cfg.parquet_decode_workers,
+                prepare=prepare,
+            ):
                 row_counts[table_name] = _insert_table(
-                    conn, table_name, df, batch_rows=cfg.batch_rows
+                    conn,
+                    table_name,
+                    df,
+                    batch_rows=cfg.batch_rows,
+                    shape=shapes.get(table_name),
+                    prepared=table_name in shapes,
                 )
 
             conn.execute("COMMIT;")
@@ -137,6 +169,8 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
                 routes_fares_source_id=routes_fares_source_id,
                 create_debug_tables=cfg.create_headway_debug_tables,
             )
+            # temp_store is MEMORY: release the mapping before maintenance/VACUUM.
+            conn.execute("DROP TABLE IF EXISTS temp.map_route_source;")
             timings["headway_resolve_seconds"] = time.perf_counter() - t2b
             row_counts["pattern_headways"] = int(headway_stats.inserted_rows)
 
@@ -147,7 +181,7 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
             schema_version=schema_version,
             bundle_id=bundle_id,
             bundle_version=bundle_version,
-            validation_reports=validation_reports,
+            report_digests=report_digests,
         )
         timings["meta_seconds"] = time.perf_counter() - t3
 
@@ -159,7 +193,7 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
         # Final pragmas and check
         t5 = time.perf_counter()
         _apply_final_pragmas(conn, cfg)
-        sql_integrity_checks(conn)
+        sql_integrity_checks(conn, integrity_level=cfg.integrity_level)
         timings["checks_seconds"] = time.perf_counter() - t5
 
         # Drop headway tables per mode after checks (tables removed from final bundle)
@@ -176,7 +210,7 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
             timings=timings,
             bundle_id=bundle_id,
             bundle_version=bundle_version,
-            validation_reports=validation_reports,
+            report_digests=report_digests,
             headway_stats=headway_stats,
         )
     finally:
@@ -188,6 +222,12 @@ def build_sqlite_bundle(params: BuildBundleParams) -> dict[str, Any]:
 
 
 def _apply_import_pragmas(conn: sqlite3.Connection, cfg: CommitConfig) -> None:
+    # page_size only takes effect on an empty database, so this runs before the DDL.
+    conn.execute(f"PRAGMA page_size = {int(cfg.page_size_bytes)};")
+    # The temp build file has exactly one writer; hold the lock for the whole build.
+    conn.execute("PRAGMA locking_mode = EXCLUSIVE;")
+    conn.execute(f"PRAGMA mmap_size = {int(cfg.mmap_size_bytes)};")
+    conn.execute("PRAGMA secure_delete = OFF;")
     conn.execute(f"PRAGMA journal_mode = {cfg.import_journal_mode};")
     conn.execute(f"PRAGMA synchronous = {cfg.import_synchronous};")
     conn.execute("PRAGMA temp_store = MEMORY;")
@@ -203,6 +243,9 @@ def _apply_final_pragmas(conn: sqlite3.Connection, cfg: CommitConfig) -> None:
 
 
 def _post_load_maintenance(conn: sqlite3.Connection, cfg: CommitConfig) -> None:
+    if cfg.run_analyze or cfg.run_optimize:
+        # Bounded sampling per index instead of full scans; 0 means unlimited.
+        conn.execute(f"PRAGMA analysis_limit = {int(cfg.analysis_limit)};")
     if cfg.run_analyze:
         conn.execute("ANALYZE;")
     if cfg.run_optimize:
@@ -220,25 +263,180 @@ def _set_schema_user_version(conn: sqlite3.Connection, schema_version: int) -> N
 # Insertions
 
 
+@dataclass(frozen=True, slots=True)
+class _TableShape:
+    columns: list[str]
+    pk_cols: list[str]
+    insert_sql: str
+
+
+def _introspect_all_tables(conn: sqlite3.Connection) -> dict[str, _TableShape]:
+    """
+    Columns, PK and INSERT statement for every table, from one catalog query.
+    """
+    rows = conn.execute(
+        "SELECT m.name, p.name, p.pk "
+        "FROM sqlite_master AS m, pragma_table_info(m.name) AS p "
+        "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+        "ORDER BY m.name, p.cid;"
+    ).fetchall()
+
+    by_table: dict[str, list[tuple[str, int]]] = {}
+    for table, col, pk in rows:
+        by_table.setdefault(table, []).append((col, int(pk or 0)))
+
+    shapes: dict[str, _TableShape] = {}
+    for table, cols in by_table.items():
+        names = [c for c, _ in cols]
+        pk_cols = [c for c, pk in sorted(cols, key=lambda x: x[1]) if pk > 0]
+        shapes[table] = _TableShape(
+            columns=names,
+            pk_cols=pk_cols,
+            insert_sql=_make_insert_sql(table, names),
+        )
+    return shapes
+
+
+def _read_tables_ahead(
+    table_inputs: Mapping[str, Path],
+    names: list[str],
+    *,
+    workers: int,
+    prepare: Callable[[str, pl.DataFrame], pl.DataFrame] | None = None,
+) -> Iterator[tuple[str, pl.DataFrame]]:
+    """
+    Yield (name, frame) in `names` order while decoding up to `workers` tables ahead.
+
+    Parquet decode (and `prepare`, if given) runs in polars' native code without
+    the GIL, so it overlaps with the single SQLite writer consuming the previous
+    table.
+    """
+
+    def load(name: str) -> pl.DataFrame:
+        df = pl.read_parquet(table_inputs[name])
+        return prepare(name, df) if prepare is not None else df
+
+    if workers <= 0:
+        for name in names:
+            yield name, load(name)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque[tuple[str, Future[pl.DataFrame]]] = deque()
+        todo = iter(names)
+        for name in islice(todo, workers):
+            pending.append((name, pool.submit(load, name)))
+        while pending:
+            name, fut = pending.popleft()
+            nxt = next(todo, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(load, nxt)))
+            yield name, fut.result()
+
+
 def _insert_table(
-    conn: sqlite3.Connection, table_name: str, df: pl.DataFrame, batch_rows: int
+    conn: sqlite3.Connection,
+    table_name: str,
+    df: pl.DataFrame,
+    batch_rows: int,
+    *,
+    pre_sort_min_rows: int = 0,
+    shape: _TableShape | None = None,
+    prepared: bool = False,
 ) -> int:
-    expected_cols, pk_cols = _expected_cols_and_pk(conn, table_name)
-    _validate_columns(table_name, expected_cols, df.columns)
+    """
+    Stream `df` into `table_name`.
+
+    Pass prepared=True when `df` already went through _prepare_for_insert.
+    """
+    if batch_rows <= 0:
+        raise ValueError("chunk size must be > 0")
+
+    if shape is None:
+        expected_cols, pk_cols = _expected_cols_and_pk(conn, table_name)
+        sql = _make_insert_sql(table_name, expected_cols)
+    else:
+        expected_cols, pk_cols, sql = shape.columns, shape.pk_cols, shape.insert_sql
+
+    if not prepared:
+        df = _prepare_for_insert(
+            table_name,
+            df,
+            expected_cols,
+            pk_cols,
+            pre_sort_min_rows=pre_sort_min_rows,
+        )
+
+    # Cells are already sqlite-ready, so rows go straight from polars to one
+    # executemany; batch_rows bounds how many rows polars materializes at a time.
+    conn.executemany(sql, df.iter_rows(named=False, buffer_size=batch_rows))
 
-    df2 = df.select(expected_cols)
-    if pk_cols:
+    return int(df.height)
+
+
+def _prepare_for_insert(
+    table_name: str,
+    df: pl.DataFrame,
+    columns: list[str],
+    pk_cols: list[str],
+    *,
+    pre_sort_min_rows: int = 0,
+) -> pl.DataFrame:
+    """
+    Project to the table's columns in DDL order, PK-sort if needed, coerce cells.
+    """
+    _validate_columns(table_name, columns, df.columns)
+
+    df2 = df.select(columns)
+    if pk_cols and df2.height >= pre_sort_min_rows and not _is_sorted_by(df2, pk_cols):
         # determinism: stable content order in sqlite pages (good enough w/ same sqlite version)
         df2 = df2.sort(pk_cols)
+    return _sqlite_ready(df2)
 
-    sql = _make_insert_sql(table_name, expected_cols)
-    total = int(df2.height)
 
-    row_iter = df2.iter_rows(named=False)
-    for batch in _chunked(row_iter, batch_rows):
-        conn.executemany(sql, [tuple(_coerce_cell(v) for v in row) for row in batch])
+def _is_sorted_by(df: pl.DataFrame, cols: list[str]) -> bool:
+    """
+    True if rows are already in ascending lexicographic `cols` order.
 
-    return total
+    One vectorized O(n) pass against the previous row, so key-ordered input (the
+    normalize stage stable-sorts its outputs) skips the O(n log n) sort.
+    """
+    if df.height < 2:
+        return True
+    if len(cols) == 1:
+        return df.get_column(cols[0]).is_sorted()
+
+    greater = pl.lit(False)
+    equal = pl.lit(True)
+    for c in cols:
+        cur, prev = pl.col(c), pl.col(c).shift(1)
+        greater = greater | (equal & (cur > prev))
+        equal = equal & (cur == prev)
+    in_order = (greater | equal).slice(1)
+    return bool(df.select(in_order.all()).item())
+
+
+def _sqlite_ready(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Vectorized equivalent of the old per-cell coercion: bools as 0/1, dates and
+    datetimes as their Python isoformat() strings.
+    """
+    exprs: list[pl.Expr] = []
+    for name, dtype in df.schema.items():
+        col = pl.col(name)
+        if dtype == pl.Boolean:
+            exprs.append(col.cast(pl.Int8))
+        elif dtype == pl.Date:
+            exprs.append(col.cast(pl.Utf8))
+        elif isinstance(dtype, pl.Datetime):
+            tz = "%:z" if dtype.time_zone else ""
+            exprs.append(
+                pl.when(col.dt.microsecond() == 0)
+                .then(col.dt.strftime(f"%Y-%m-%dT%H:%M:%S{tz}"))
+                .otherwise(col.dt.strftime(f"%Y-%m-%dT%H:%M:%S.%6f{tz}"))
+                .alias(name)
+            )
+    return df.with_columns(exprs) if exprs else df
 
 
 def _expected_cols_and_pk(
@@ -278,27 +476,17 @@ def _make_insert_sql(table_name: str, columns: list[str]) -> str:
     return f"INSERT INTO {_quote_ident(table_name)} ({cols}) VALUES ({placeholders});"
 
 
-def _chunked(it: Iterator[tuple[Any, ...]], n: int) -> Iterator[list[tuple[Any, ...]]]:
-    if n <= 0:
-        raise ValueError("chunk size must be > 0")
-    batch: list[tuple[Any, ...]] = []
-    for row in it:
-        batch.append(row)
-        if len(batch) >= n:
-            yield batch
-            batch = []
-    if batch:
-        yield batch
-
-
-def _coerce_cell(v: Any) -> Any:
-    if v is None:
-        return None
-    if isinstance(v, bool):
-        return 1 if v else 0
-    if isinstance(v, (dt.date, dt.datetime)):
-        return v.isoformat()
-    return v
+def _report_digests(validation_reports: Mapping[str, Path]) -> dict[str, str]:
+    """
+    sha256 of each validation report, keyed by source id in sorted order.
+    """
+    items = sorted(validation_reports.items())
+    if len(items) <= 1:
+        return {sid: sha256_file(p).sha256 for sid, p in items}
+    # hashlib releases the GIL on large buffers, so reports hash in parallel.
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+        digests = pool.map(lambda p: sha256_file(p).sha256, (p for _, p in items))
+        return dict(zip((sid for sid, _ in items), digests))
 
 
 def _populate_meta_row(
@@ -307,7 +495,7 @@ def _populate_meta_row(
     schema_version: int,
     bundle_id: str,
     bundle_version: str,
-    validation_reports: Mapping[str, Path],
+    report_digests: Mapping[str, str],
 ) -> None:
     meta_exists = conn.execute(
         "SELECT 1 FROM sqlite_master WHERE type='table' AND name='meta' LIMIT 1;"
@@ -318,17 +506,12 @@ def _populate_meta_row(
     now_utc = dt.datetime.now(tz=dt.timezone.utc).isoformat()
 
     src_versions = {
-        sid: {"version": bundle_version} for sid in sorted(validation_reports.keys())
+        sid: {"version": bundle_version} for sid in sorted(report_digests.keys())
     }
-    src_versions_json = json.dumps(
-        src_versions, ensure_ascii=False, sort_keys=True, separators=(",", ":")
-    )
+    src_versions_json = stable_json_dumps(src_versions, indent=None)
 
-    digests = {
-        sid: sha256_file(p).sha256 for sid, p in sorted(validation_reports.items())
-    }
     notes = stable_json_dumps(
-        {"bundle_id": bundle_id, "validation_reports_sha256": digests}
+        {"bundle_id": bundle_id, "validation_reports_sha256": dict(report_digests)}
     )
 
     conn.execute(
@@ -341,6 +524,15 @@ def _populate_meta_row(
     )
 
 
+# One statement over the pragma table-valued functions instead of seven reads.
+_BUILD_PRAGMAS_SQL = """
+SELECT sqlite_version() AS sqlite_version, journal_mode, synchronous,
+       foreign_keys, cache_size, page_size, user_version
+FROM pragma_journal_mode(), pragma_synchronous(), pragma_foreign_keys(),
+     pragma_cache_size(), pragma_page_size(), pragma_user_version();
+"""
+
+
 def _build_metadata(
     *,
     cfg: CommitConfig,
@@ -350,19 +542,12 @@ def _build_metadata(
     timings: Mapping[str, float],
     bundle_id: str,
     bundle_version: str,
-    validation_reports: Mapping[str, Path],
+    report_digests: Mapping[str, str],
     headway_stats: HeadwayResolveStats,
 ) -> dict[str, Any]:
-    sqlite_version = conn.execute("select sqlite_version();").fetchone()[0]
-    pragmas = {
-        "journal_mode": conn.execute("PRAGMA journal_mode;").fetchone()[0],
-        "synchronous": conn.execute("PRAGMA synchronous;").fetchone()[0],
-        "foreign_keys": conn.execute("PRAGMA foreign_keys;").fetchone()[0],
-        "cache_size": conn.execute("PRAGMA cache_size;").fetchone()[0],
-        "user_version": conn.execute("PRAGMA user_version;").fetchone()[0],
-    }
-
-    vr = {sid: sha256_file(p).sha256 for sid, p in sorted(validation_reports.items())}
+    cur = conn.execute(_BUILD_PRAGMAS_SQL)
+    sqlite_version, *values = cur.fetchone()
+    pragmas = dict(zip((d[0] for d in cur.description[1:]), values))
 
     return {
         "schema_version": int(pragmas["user_version"]),
@@ -372,7 +557,7 @@ def _build_metadata(
         "bundle": {"bundle_id": bundle_id, "bundle_version": bundle_version},
         "inputs": {
             "canonical_ddl_sha256": sha256_bytes(ddl_sql.encode("utf-8")),
-            "validation_reports_sha256": vr,
+            "validation_reports_sha256": dict(report_digests),
         },
         "row_counts": dict(row_counts),
         "timings_seconds": dict(timings),
@@ -383,10 +568,7 @@ def _build_metadata(
 
 def _write_json(path: Path, obj: Any) -> None:
     tmp = path.with_suffix(".tmp.json")
-    tmp.write_text(
-        json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")),
-        encoding="utf-8",
-    )
+    tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS))
     os.replace(tmp, path)
 
 
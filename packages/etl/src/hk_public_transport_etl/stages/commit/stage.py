@@ -13,7 +13,7 @@ from hk_public_transport_etl.registry.loader import (
 from hk_public_transport_etl.registry.models import SourceSpec
 
 from .config import CommitConfig
-from .runner import run_commit_bundle
+from .runner import _scan_parquet_tables, run_commit_bundle
 
 
 class CommitSourceSummary(TypedDict):
@@ -38,14 +38,16 @@ def _select_specs(ctx: RunContext, *, version: str) -> list[SourceSpec]:
     config_dir = ctx.meta.get("config_dir")
     cfg_dir = resolve_config_dir(Path(str(config_dir)) if config_dir else None)
 
+    # get_source_registry reuses the loaded registry across stages until a config
+    # file changes; select straight from it rather than building a filtered copy.
     reg = get_source_registry(cfg_dir)
 
     only_ids = ctx.meta.get("source_ids")
-    if only_ids is not None:
-        wanted = {str(x) for x in only_ids}
-        reg = {k: v for k, v in reg.items() if k in wanted}
-
-    specs = [reg[k] for k in sorted(reg.keys())]
+    if only_ids is None:
+        ids = sorted(reg)
+    else:
+        ids = sorted({str(x) for x in only_ids}.intersection(reg))
+    specs = [reg[k] for k in ids]
     if not specs:
         raise ValueError("No sources selected (registry empty or filtered to nothing).")
 
@@ -87,10 +89,7 @@ def stage_commit(ctx: RunContext) -> CommitStageOutput:
         tables_dir = layout.normalized_tables(sid, version)
         report_path = layout.validation_report_json(sid, version)
 
-        parquet_files = (
-            sorted(tables_dir.glob("*.parquet")) if tables_dir.exists() else []
-        )
-        included = len(parquet_files) > 0
+        included = bool(_scan_parquet_tables(tables_dir))
 
         summary: CommitSourceSummary = {
             "source_id": sid,
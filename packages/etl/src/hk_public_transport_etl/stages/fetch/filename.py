@@ -6,6 +6,7 @@ from typing import Mapping
 from hk_public_transport_etl.registry import EndpointSpec
 
 _safe_re = re.compile(r"[^a-zA-Z0-9._\-]+")
+_cd_filename_re = re.compile(r'filename\*?=(?:"([^"]+)"|([^;]+))', re.IGNORECASE)
 
 
 def sanitize(name: str) -> str:
@@ -17,9 +18,7 @@ def sanitize(name: str) -> str:
 def cd_filename(content_disposition: str | None) -> str | None:
     if not content_disposition:
         return None
-    m = re.search(
-        r'filename\*?=(?:"([^"]+)"|([^;]+))', content_disposition, flags=re.IGNORECASE
-    )
+    m = _cd_filename_re.search(content_disposition)
     if not m:
         return None
     v = (m.group(1) or m.group(2) or "").strip()
@@ -31,8 +30,14 @@ def resolve_artifact_filename(
     endpoint: EndpointSpec,
     uri: str,
     response_headers: Mapping[str, str | None],
-    used_names: set[str],
+    used_names: dict[str, int],
 ) -> str:
+    """
+    Pick a unique artifact filename and record it in `used_names`.
+
+    `used_names` maps every taken name to the next numeric suffix to try for it,
+    so repeated collisions on one base resume probing instead of restarting at 2.
+    """
     if endpoint.filename:
         base = sanitize(endpoint.filename)
     else:
@@ -40,12 +45,18 @@ def resolve_artifact_filename(
         if cd:
             base = sanitize(cd)
         else:
-            base = sanitize(uri.rstrip("/").split("/")[-1])
+            base = sanitize(uri.rstrip("/").rpartition("/")[2])
+
+    if base not in used_names:
+        used_names[base] = 2
+        return base
 
-    name = base
-    i = 2
+    stem, dot, ext = base.partition(".")
+    i = used_names[base]
+    name = f"{stem}_{i}{dot}{ext}" if dot else f"{base}_{i}"
     while name in used_names:
-        stem, dot, ext = base.partition(".")
-        name = f"{stem}_{i}{dot}{ext}" if dot else f"{base}_{i}"
         i += 1
+        name = f"{stem}_{i}{dot}{ext}" if dot else f"{base}_{i}"
+    used_names[base] = i + 1
+    used_names[name] = 2
     return name
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import datetime as dt
+import hashlib
 import os
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Iterable, Mapping
 
@@ -9,10 +13,15 @@ import httpx
 import structlog
 from hk_public_transport_etl.core import safe_unlink
 from hk_public_transport_etl.core.errors import InputDataError, TransientError
+from hk_public_transport_etl.core.fs import _DROP_CACHE_MIN_BYTES, drop_page_cache
 from tenacity import RetryError, Retrying, retry_if_exception_type, stop_after_attempt
 from tenacity.wait import wait_base
 
 _RETRYABLE_STATUSES: set[int] = {408, 429, 500, 502, 503, 504}
+# Downloads are hashed between requests, so idle sockets outlive httpx's 5s default.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=16, max_connections=32, keepalive_expiry=30.0
+)
 
 log = structlog.get_logger(__name__)
 
@@ -62,9 +71,18 @@ def make_http_client(
     follow_redirects: bool = True,
     user_agent: str = "hk-public-transport-etl/0.1",
     transport: httpx.BaseTransport | None = None,
+    http2: bool | None = None,
 ) -> httpx.Client:
+    """
+    One client per fetch stage; its pool keeps TLS sessions to each origin alive
+    across sequential downloads. http2=None enables HTTP/2 when `h2` is installed.
+    """
     t = timeout or httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0)
+    if http2 is None:
+        http2 = find_spec("h2") is not None
     return httpx.Client(
+        http2=http2,
+        limits=_POOL_LIMITS,
         timeout=t,
         follow_redirects=follow_redirects,
         headers={"User-Agent": user_agent},
@@ -77,11 +95,23 @@ def is_retryable_status(code: int) -> bool:
 
 
 class DeterministicExponentialBackoff(wait_base):
-    def __init__(self, *, base: float = 0.5, cap: float = 4.0) -> None:
+    """
+    0, base, 2*base, ... capped at `cap`; a server Retry-After on a retryable
+    status wins instead, capped at `retry_after_cap`.
+    """
+
+    def __init__(
+        self, *, base: float = 0.5, cap: float = 4.0, retry_after_cap: float = 60.0
+    ) -> None:
         self._base = float(base)
         self._cap = float(cap)
+        self._retry_after_cap = float(retry_after_cap)
 
     def __call__(self, retry_state) -> float:
+        outcome = retry_state.outcome
+        exc = outcome.exception() if outcome is not None and outcome.failed else None
+        if isinstance(exc, RetryableHttpStatus) and exc.retry_after is not None:
+            return min(self._retry_after_cap, exc.retry_after)
         n = retry_state.attempt_number
         if n <= 1:
             return 0.0
@@ -93,6 +123,28 @@ class RetryableHttpStatus(Exception):
     method: str
     url: str
     status_code: int
+    retry_after: float | None = None
+
+
+def parse_retry_after(
+    value: str | None, *, now: dt.datetime | None = None
+) -> float | None:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP-date).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    now = now or dt.datetime.now(tz=dt.timezone.utc)
+    return max(0.0, (when - now).total_seconds())
 
 
 def _retrying(
@@ -254,7 +306,10 @@ def request_with_retries(
 
         if is_retryable_status(resp.status_code):
             raise RetryableHttpStatus(
-                method=method, url=url, status_code=resp.status_code
+                method=method,
+                url=url,
+                status_code=resp.status_code,
+                retry_after=parse_retry_after(resp.headers.get("Retry-After")),
             )
 
         raise HttpStatusError(
@@ -275,10 +330,25 @@ def request_with_retries(
     )
 
 
+# Downloaded chunks are gathered up to this size and written with one writev().
+_WRITEV_FLUSH_BYTES = 1 << 20
+
+
+def _writev_all(fd: int, bufs: list[bytes], size: int) -> None:
+    n = os.writev(fd, bufs)
+    if n < size:
+        # Short write (rare on regular files): finish the remainder plainly.
+        rest = memoryview(b"".join(bufs))[n:]
+        while rest:
+            rest = rest[os.write(fd, rest) :]
+
+
 @dataclass(frozen=True, slots=True)
 class HttpDownloadResult:
     info: HttpResponseInfo
     bytes_written: int
+    # Hex digest of the written body, hashed as it streamed; None for 304.
+    sha256: str | None = None
 
 
 def stream_get_to_file_with_retries(
@@ -310,7 +380,10 @@ def stream_get_to_file_with_retries(
                 snippet = _body_snippet(resp)
                 if is_retryable_status(resp.status_code):
                     raise RetryableHttpStatus(
-                        method="GET", url=url, status_code=resp.status_code
+                        method="GET",
+                        url=url,
+                        status_code=resp.status_code,
+                        retry_after=parse_retry_after(resp.headers.get("Retry-After")),
                     )
                 raise HttpStatusError(
                     method="GET",
@@ -327,20 +400,38 @@ def stream_get_to_file_with_retries(
             dest.parent.mkdir(parents=True, exist_ok=True)
 
             total = 0
+            h = hashlib.sha256()
             try:
-                with dest.open("wb") as f:
+                fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    buf: list[bytes] = []
+                    buf_size = 0
                     for chunk in resp.iter_bytes(chunk_size=chunk_bytes):
                         if not chunk:
                             continue
-                        f.write(chunk)
-                        total += len(chunk)
-                    f.flush()
-                    os.fsync(f.fileno())
+                        h.update(chunk)
+                        buf.append(chunk)
+                        buf_size += len(chunk)
+                        if buf_size >= _WRITEV_FLUSH_BYTES or len(buf) >= 64:
+                            _writev_all(fd, buf, buf_size)
+                            total += buf_size
+                            buf.clear()
+                            buf_size = 0
+                    if buf:
+                        _writev_all(fd, buf, buf_size)
+                        total += buf_size
+                    os.fsync(fd)
+                    if total >= _DROP_CACHE_MIN_BYTES:
+                        drop_page_cache(fd)
+                finally:
+                    os.close(fd)
             except Exception:
                 safe_unlink(dest)
                 raise
 
-            return HttpDownloadResult(info=info, bytes_written=total)
+            return HttpDownloadResult(
+                info=info, bytes_written=total, sha256=h.hexdigest()
+            )
 
     try:
         return _run_with_retries(
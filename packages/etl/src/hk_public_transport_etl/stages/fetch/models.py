@@ -34,9 +34,12 @@ class RawMetadata(BaseModel):
     errors: dict[str, str] = Field(default_factory=dict)
     version: str
     _artifact_map: dict[str, RawMetadataArtifact] = PrivateAttr(default_factory=dict)
+    # endpoint_id -> position in `artifacts`, so upserts update in place.
+    _index: dict[str, int] = PrivateAttr(default_factory=dict)
 
     def model_post_init(self, _: object) -> None:
         self._artifact_map = {a.endpoint_id: a for a in self.artifacts}
+        self._index = {a.endpoint_id: i for i, a in enumerate(self.artifacts)}
 
     def by_endpoint(self) -> dict[str, RawMetadataArtifact]:
         return dict(self._artifact_map)
@@ -45,8 +48,13 @@ class RawMetadata(BaseModel):
         return self._artifact_map.get(endpoint_id)
 
     def upsert_artifact(self, a: RawMetadataArtifact) -> None:
+        idx = self._index.get(a.endpoint_id)
+        if idx is None:
+            self._index[a.endpoint_id] = len(self.artifacts)
+            self.artifacts.append(a)
+        else:
+            self.artifacts[idx] = a
         self._artifact_map[a.endpoint_id] = a
-        self.artifacts = list(self._artifact_map.values())
 
     def set_error(self, endpoint_id: str, msg: str) -> None:
         self.errors[endpoint_id] = msg
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
 import httpx
 import structlog
@@ -12,6 +15,7 @@ from hk_public_transport_etl.core import (
     sha256_file,
     utc_now_iso,
 )
+from hk_public_transport_etl.core.hashing import FileDigest
 from hk_public_transport_etl.core.paths import DataLayout
 from hk_public_transport_etl.registry import EndpointSpec, SourceSpec
 from hk_public_transport_etl.stages.fetch.filename import resolve_artifact_filename
@@ -83,13 +87,13 @@ def _persist_successful_download(
     source_id: str,
     uri: str,
     info: HttpResponseInfo,
-    digest,
+    digest: FileDigest,
     retrieved_at: str,
     existing: RawMetadataArtifact | None,
     version_root: Path,
     artifacts_dir: Path,
     tmp_path: Path,
-    used_names: set[str],
+    used_names: dict[str, int],
     meta: RawMetadata,
     meta_path: Path,
     force: bool,
@@ -107,7 +111,6 @@ def _persist_successful_download(
             },
             used_names=used_names,
         )
-        used_names.add(name)
         final_path = artifacts_dir / name
 
     # immutability rule (within source/version)
@@ -146,7 +149,9 @@ def _persist_successful_download(
         final_path.parent.mkdir(parents=True, exist_ok=True)
         Path(tmp_path).replace(final_path)
 
-    entry = RawMetadataArtifact(
+    # Every field comes from values produced here (hexdigest, byte count, strings),
+    # so skip per-field validation; loads still validate via model_validate_json.
+    entry = RawMetadataArtifact.model_construct(
         endpoint_id=endpoint.id,
         uri=uri,
         final_url=info.final_url,
@@ -253,6 +258,22 @@ def _new_tmp_path(tmp_dir: Path, endpoint_id: str) -> Path:
     )
 
 
+@dataclass(slots=True)
+class _EndpointDownload:
+    """
+    Outcome of trying an endpoint's candidates; info is None when all failed.
+    """
+
+    endpoint: EndpointSpec
+    existing: RawMetadataArtifact | None
+    uri: str | None = None
+    info: HttpResponseInfo | None = None
+    digest: FileDigest | None = None
+    tmp_path: Path | None = None
+    retrieved_at: str | None = None
+    last_err: BaseException | None = None
+
+
 def fetch_source(
     *,
     spec: SourceSpec,
@@ -261,11 +282,15 @@ def fetch_source(
     force: bool = False,
     client: httpx.Client | None = None,
     max_attempts: int = 3,
+    max_workers: int = 4,
 ) -> RawFetchResult:
     """
     Fetch all endpoints for a source into:
       data/raw/{source_id}/{version}/artifacts/...
       data/raw/{source_id}/{version}/raw_metadata.json
+
+    Up to `max_workers` endpoints download (and hash) concurrently on the shared
+    client; results are then committed to disk and metadata in endpoint order.
     """
     source_id = spec.id
     version_root, artifacts_dir, tmp_dir, meta_path = _ensure_raw_dirs(
@@ -273,26 +298,57 @@ def fetch_source(
     )
     meta = _load_or_init_meta(meta_path, source_id=source_id, version=version)
 
-    used_names = {a.filename for a in meta.artifacts}
+    used_names = dict.fromkeys((a.filename for a in meta.artifacts), 2)
     owns_client = client is None
     if client is None:
         client = make_http_client()
 
+    existing_by_id: dict[str, RawMetadataArtifact | None] = {}
+    for endpoint in spec.endpoints:
+        existing = meta.get_artifact(endpoint.id)
+        # verify cached bytes if present
+        if existing is not None:
+            try:
+                _verify_cached_artifact(version_root=version_root, a=existing)
+            except CacheCorruptionError as e:
+                meta.set_error(endpoint.id, str(e))
+                _write_meta_atomic(meta_path, meta)
+                raise
+        existing_by_id[endpoint.id] = existing
+
+    def download(endpoint: EndpointSpec) -> _EndpointDownload:
+        return _download_endpoint(
+            spec=spec,
+            endpoint=endpoint,
+            existing=existing_by_id[endpoint.id],
+            tmp_dir=tmp_dir,
+            client=client,
+            max_attempts=max_attempts,
+        )
+
     out: list[RawArtifact] = []
+    workers = min(max_workers, len(spec.endpoints))
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    futures: list[Future[_EndpointDownload]] = []
+    committed = 0
     try:
-        for endpoint in spec.endpoints:
-            art = _fetch_endpoint(
-                spec=spec,
-                endpoint=endpoint,
+        if pool is None:
+            downloads: Iterable[_EndpointDownload] = map(download, spec.endpoints)
+        else:
+            futures = [pool.submit(download, ep) for ep in spec.endpoints]
+            downloads = (f.result() for f in futures)
+
+        for dl in downloads:
+            committed += 1
+            art = _commit_endpoint(
+                dl,
+                source_id=source_id,
                 version_root=version_root,
                 artifacts_dir=artifacts_dir,
-                tmp_dir=tmp_dir,
                 meta_path=meta_path,
                 meta=meta,
                 used_names=used_names,
-                client=client,
                 force=force,
-                max_attempts=max_attempts,
             )
             if art is not None:
                 out.append(art)
@@ -304,37 +360,42 @@ def fetch_source(
             raw_metadata_path=str(meta_path),
         )
     finally:
+        if pool is not None:
+            _discard_downloads(pool, futures[committed:])
         if owns_client:
             client.close()
 
 
-def _fetch_endpoint(
+def _discard_downloads(
+    pool: ThreadPoolExecutor, futures: list[Future[_EndpointDownload]]
+) -> None:
+    """
+    Cancel or clean up downloads left uncommitted after an earlier endpoint failed.
+    """
+    for f in futures:
+        f.cancel()
+    pool.shutdown(wait=True)
+    for f in futures:
+        if not f.cancelled() and f.exception() is None:
+            tmp = f.result().tmp_path
+            if tmp is not None:
+                safe_unlink(tmp)
+
+
+def _download_endpoint(
     *,
     spec: SourceSpec,
     endpoint: EndpointSpec,
-    version_root: Path,
-    artifacts_dir: Path,
+    existing: RawMetadataArtifact | None,
     tmp_dir: Path,
-    meta_path: Path,
-    meta: RawMetadata,
-    used_names: set[str],
     client: httpx.Client,
-    force: bool,
     max_attempts: int,
-) -> RawArtifact | None:
+) -> _EndpointDownload:
+    """
+    Try candidates in order until one yields a usable 200/304. Touches no metadata.
+    """
     source_id = spec.id
-    existing = meta.get_artifact(endpoint.id)
-
-    # verify cached bytes if present
-    if existing is not None:
-        try:
-            _verify_cached_artifact(version_root=version_root, a=existing)
-        except CacheCorruptionError as e:
-            meta.set_error(endpoint.id, str(e))
-            _write_meta_atomic(meta_path, meta)
-            raise
-
-    candidates = endpoint.resolved_url_candidates(spec.base_urls)
+    candidates = spec.url_candidates(endpoint)
     candidates = _prioritize_existing_uri(
         candidates, existing.uri if existing else None
     )
@@ -366,17 +427,17 @@ def _fetch_endpoint(
                 )
                 continue
 
-            return _handle_not_modified(
+            return _EndpointDownload(
+                endpoint=endpoint,
                 existing=existing,
+                uri=uri,
                 info=dl.info,
                 retrieved_at=retrieved_at,
-                version_root=version_root,
-                meta=meta,
-                meta_path=meta_path,
             )
 
         # 200
-        digest = sha256_file(Path(tmp_path))
+        assert dl.sha256 is not None
+        digest = FileDigest(sha256=dl.sha256, bytes=dl.bytes_written)
         if digest.bytes <= 0:
             safe_unlink(tmp_path)
             last_err = StageFetchError(
@@ -384,17 +445,57 @@ def _fetch_endpoint(
             )
             continue
 
-        return _persist_successful_download(
+        return _EndpointDownload(
             endpoint=endpoint,
-            source_id=source_id,
+            existing=existing,
             uri=uri,
             info=dl.info,
             digest=digest,
+            tmp_path=Path(tmp_path),
             retrieved_at=retrieved_at,
-            existing=existing,
+        )
+
+    return _EndpointDownload(endpoint=endpoint, existing=existing, last_err=last_err)
+
+
+def _commit_endpoint(
+    dl: _EndpointDownload,
+    *,
+    source_id: str,
+    version_root: Path,
+    artifacts_dir: Path,
+    meta_path: Path,
+    meta: RawMetadata,
+    used_names: dict[str, int],
+    force: bool,
+) -> RawArtifact | None:
+    endpoint = dl.endpoint
+
+    if dl.info is not None and dl.info.status_code == 304:
+        assert dl.existing is not None and dl.retrieved_at is not None
+        return _handle_not_modified(
+            existing=dl.existing,
+            info=dl.info,
+            retrieved_at=dl.retrieved_at,
+            version_root=version_root,
+            meta=meta,
+            meta_path=meta_path,
+        )
+
+    if dl.info is not None:
+        assert dl.uri is not None and dl.tmp_path is not None and dl.digest is not None
+        assert dl.retrieved_at is not None
+        return _persist_successful_download(
+            endpoint=endpoint,
+            source_id=source_id,
+            uri=dl.uri,
+            info=dl.info,
+            digest=dl.digest,
+            retrieved_at=dl.retrieved_at,
+            existing=dl.existing,
             version_root=version_root,
             artifacts_dir=artifacts_dir,
-            tmp_path=Path(tmp_path),
+            tmp_path=dl.tmp_path,
             used_names=used_names,
             meta=meta,
             meta_path=meta_path,
@@ -402,6 +503,7 @@ def _fetch_endpoint(
         )
 
     # none succeeded
+    last_err = dl.last_err
     msg = f"{source_id}/{endpoint.id}: fetch failed for all candidates: {last_err}"
     meta.set_error(endpoint.id, msg)
     _write_meta_atomic(meta_path, meta)
@@ -22,6 +22,7 @@ def stage_fetch(ctx: RunContext) -> dict[str, Any]:
     version = str(ctx.meta["version"])
     force = bool(ctx.meta.get("force", False))
     max_attempts = int(ctx.meta.get("max_attempts", 3))
+    max_workers = int(ctx.meta.get("fetch_workers", 4))
 
     config_dir = ctx.meta.get("config_dir")
     cfg_dir = resolve_config_dir(Path(config_dir) if config_dir else None)
@@ -76,6 +77,7 @@ def stage_fetch(ctx: RunContext) -> dict[str, Any]:
                 force=force,
                 client=client,
                 max_attempts=max_attempts,
+                max_workers=max_workers,
             )
 
             artifacts = [a.to_dict() for a in res.artifacts]
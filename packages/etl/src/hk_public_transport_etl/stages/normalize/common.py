@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
@@ -10,7 +12,7 @@ from hk_public_transport_etl.core import (
     NormalizeError,
     atomic_write_json,
     read_parquet_df,
-    table_meta_from_df,
+    table_meta_from_parquet,
     write_parquet_atomic,
 )
 
@@ -92,7 +94,8 @@ class NormalizeWriter:
 
         base.mkdir(parents=True, exist_ok=True)
         path = base / f"{name}.parquet"
-        write_parquet_atomic(df, path)
+        # Normalized tables are rebuilt on every run.
+        write_parquet_atomic(df, path, durability="none")
 
         if kind == "canonical":
             self.canonical_paths[name] = path
@@ -112,20 +115,25 @@ class NormalizeWriter:
         inputs: JsonObject,
         warnings: list[JsonObject],
     ) -> Path:
-        outputs: dict[str, OutputTableMeta] = {}
-
-        def add_meta(kind: str, name: str, path: Path) -> None:
-            df = read_parquet_df(path)
-            m = table_meta_from_df(path, df)
+        def table_meta(kind: str, path: Path) -> OutputTableMeta:
+            m = table_meta_from_parquet(path)
             m["kind"] = kind  # TypedDict field overwrite is OK
-            outputs[name] = m
-
-        for n, p in self.canonical_paths.items():
-            add_meta("canonical", n, p)
-        for n, p in self.mapping_paths.items():
-            add_meta("mapping", n, p)
-        for n, p in self.unresolved_paths.items():
-            add_meta("unresolved", n, p)
+            return m
+
+        entries: list[tuple[str, str, Path]] = [
+            *(("canonical", n, p) for n, p in self.canonical_paths.items()),
+            *(("mapping", n, p) for n, p in self.mapping_paths.items()),
+            *(("unresolved", n, p) for n, p in self.unresolved_paths.items()),
+        ]
+
+        # Per-table footer reads + hashes are I/O bound and release the GIL.
+        outputs: dict[str, OutputTableMeta] = {}
+        if entries:
+            workers = min(len(entries), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                metas = pool.map(lambda e: table_meta(e[0], e[2]), entries)
+                for (_, name, _), m in zip(entries, metas):
+                    outputs[name] = m
 
         meta: NormalizedMetadata = {
             "source_id": source_id,
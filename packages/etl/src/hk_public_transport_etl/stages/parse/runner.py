@@ -256,7 +256,9 @@ def _write_one_table(*, staged_dir: Path, name: str, table: pa.Table) -> ParsedT
     out_rel = Path("tables") / f"{name}.parquet"
     out_path = staged_dir / out_rel
 
-    write_parquet_atomic(table=table, out_path=out_path)
+    # Staged tables are an intermediate rebuilt from the raw cache; the whole
+    # directory is swapped in atomically, so per-file fsync buys nothing here.
+    write_parquet_atomic(table=table, out_path=out_path, durability="none")
 
     if not out_path.exists():
         raise ParseError(f"Parquet write succeeded but file missing: {out_path}")
@@ -9,8 +9,8 @@ from typing import Any
 from hk_public_transport_etl.core import (
     PublishError,
     atomic_dir_commit,
-    atomic_write_bytes,
     atomic_write_json,
+    atomic_write_many,
     copy_or_hardlink,
     sha256_file,
     write_sha256_sum_txt,
@@ -174,12 +174,15 @@ def run_publish_bundle(
     atomic = make_tmp_dir_for(final_dir)
     tmp_dir = atomic
 
-    # Materialize files
-    copy_or_hardlink(app_db_path, tmp_dir / "app.sqlite")
-    copy_or_hardlink(transport_db_path, tmp_dir / "transport.sqlite")
+    # Materialize files. Linked/copied members are not fsync'd yet; the commit
+    # below flushes them (everything else goes through atomic_write_*).
+    materialized = [tmp_dir / "app.sqlite", tmp_dir / "transport.sqlite"]
+    copy_or_hardlink(app_db_path, materialized[0])
+    copy_or_hardlink(transport_db_path, materialized[1])
 
     if build_meta_path.exists():
-        copy_or_hardlink(build_meta_path, tmp_dir / "build_metadata.json")
+        materialized.append(tmp_dir / "build_metadata.json")
+        copy_or_hardlink(build_meta_path, materialized[-1])
 
     summary = {
         "bundle_id": bundle_id,
@@ -287,12 +290,11 @@ def run_publish_bundle(
         # Sign manifest bytes exactly (single default behavior)
         mbytes = serialize_manifest_bytes(manifest)
         sig = sign_bytes_ed25519(payload=mbytes, private_key_path=priv_path)
-        atomic_write_bytes(tmp_dir / "manifest.sig", sig)
-        sha_entries["manifest.sig"] = sha256_file(tmp_dir / "manifest.sig").sha256
-
-        atomic_write_bytes(
-            tmp_dir / "public_key.b64.txt", (signing_pub_b64 + "\n").encode("utf-8")
+        pub = (signing_pub_b64 + "\n").encode("utf-8")
+        atomic_write_many(
+            {tmp_dir / "manifest.sig": sig, tmp_dir / "public_key.b64.txt": pub}
         )
+        sha_entries["manifest.sig"] = sha256_file(tmp_dir / "manifest.sig").sha256
         sha_entries["public_key.b64.txt"] = sha256_file(
             tmp_dir / "public_key.b64.txt"
         ).sha256
@@ -303,7 +305,12 @@ def run_publish_bundle(
     sha_entries["sha256sums.txt"] = sha256_file(sha_path).sha256
 
     # Commit atomic dir
-    atomic_dir_commit(tmp_dir=tmp_dir, final_dir=final_dir, overwrite=cfg.overwrite)
+    atomic_dir_commit(
+        tmp_dir=tmp_dir,
+        final_dir=final_dir,
+        overwrite=cfg.overwrite,
+        fsync_paths=materialized,
+    )
 
     return PublishOutput(
         out_dir=final_dir,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 import time
+from itertools import islice
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -52,15 +53,12 @@ def _insert_many(
     *,
     batch: int = 50_000,
 ) -> int:
+    if batch <= 0:
+        raise ValueError("batch size must be > 0")
     total = 0
-    buf: list[tuple[Any, ...]] = []
-    for r in rows:
-        buf.append(r)
-        if len(buf) >= batch:
-            conn.executemany(sql, buf)
-            total += len(buf)
-            buf = []
-    if buf:
+    it = iter(rows)
+    # islice fills each batch in C; no per-row append/len check in Python.
+    while buf := list(islice(it, batch)):
         conn.executemany(sql, buf)
         total += len(buf)
     return total
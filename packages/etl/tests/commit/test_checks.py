@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+from hk_public_transport_etl.stages.commit.checks import (
+    integrity_check,
+    pattern_stop_contiguity_check,
+)
+
+
+def _conn(rows: list[tuple[int, int]], *, with_pk: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    pk = ", PRIMARY KEY (pattern_id, seq)" if with_pk else ""
+    conn.execute(f"CREATE TABLE pattern_stops (pattern_id INTEGER, seq INTEGER{pk})")
+    conn.executemany("INSERT INTO pattern_stops VALUES (?, ?)", rows)
+    return conn
+
+
+def test_contiguity_check_accepts_contiguous_sequences() -> None:
+    pattern_stop_contiguity_check(_conn([(1, 1), (1, 2), (1, 3), (2, 1)]))
+
+
+@pytest.mark.parametrize(
+    "rows, with_pk",
+    [
+        ([(1, 2), (1, 3)], True),  # does not start at 1
+        ([(1, 1), (1, 3)], True),  # hole
+        ([(1, 1), (1, 1), (1, 3)], False),  # duplicate masks the hole in max/count
+    ],
+)
+def test_contiguity_check_rejects_bad_sequences(
+    rows: list[tuple[int, int]], with_pk: bool
+) -> None:
+    with pytest.raises(RuntimeError, match="contiguity"):
+        pattern_stop_contiguity_check(_conn(rows, with_pk=with_pk))
+
+
+@pytest.mark.parametrize("level", ["quick", "full"])
+def test_integrity_check_levels_pass_on_healthy_db(level: str) -> None:
+    integrity_check(_conn([(1, 1)]), level=level)
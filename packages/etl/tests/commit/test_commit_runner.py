@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from hk_public_transport_etl.stages.commit.runner import _scan_parquet_tables
+
+
+def test_scan_parquet_tables_lists_sorted_parquet_files(tmp_path: Path) -> None:
+    for name in ("stops.parquet", "routes.parquet", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "nested.parquet").mkdir()
+
+    assert _scan_parquet_tables(tmp_path) == [
+        tmp_path / "routes.parquet",
+        tmp_path / "stops.parquet",
+    ]
+    assert _scan_parquet_tables(tmp_path / "missing") == []
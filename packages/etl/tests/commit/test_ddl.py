@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from hk_public_transport_etl.stages.commit import ddl
+
+
+def test_canonical_ddl_is_loaded_once() -> None:
+    ddl.load_canonical_ddl.cache_clear()
+    first = ddl.load_canonical_ddl()
+
+    assert "CREATE TABLE" in first.upper()
+    assert ddl.load_canonical_ddl() is first
+    assert ddl.load_canonical_ddl.cache_info().hits == 1
+
+
+def test_schema_version_is_an_int() -> None:
+    assert isinstance(ddl.load_schema_version(), int)
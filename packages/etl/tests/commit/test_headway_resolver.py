@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import polars as pl
+from hk_public_transport_etl.stages.commit.ddl import load_canonical_ddl
+from hk_public_transport_etl.stages.commit.resolvers import (
+    load_temp_map_route_source,
+    resolve_pattern_headways,
+)
+
+
+def _mk_conn(tmp_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.executescript(load_canonical_ddl())
+    conn.execute(
+        "INSERT INTO operators(operator_id, operator_name_en) VALUES ('op', 'OP');"
+    )
+    conn.executemany(
+        "INSERT INTO places(place_id, place_key, place_type, primary_mode, name_tc) "
+        "VALUES (?, ?, 'stop', 'bus', 'x');",
+        [(i, f"bus:{i}") for i in range(1, 4)],
+    )
+    conn.executemany(
+        "INSERT INTO routes(route_id, route_key, upstream_route_id, mode, operator_id, "
+        "route_short_name) VALUES (?, ?, ?, 'bus', 'op', ?);",
+        [(1, "bus:1", "7", "1"), (2, "bus:2", "8", "2")],
+    )
+    # route 1 / seq 1: patterns 12 and 11 tie on 3 stops (min id wins), 10 has 2.
+    # route 2 / seq 1: single pattern 20.
+    patterns = {10: (1, 2), 12: (1, 3), 11: (1, 3), 20: (2, 1)}
+    for pid, (route_id, n_stops) in patterns.items():
+        conn.execute(
+            "INSERT INTO route_patterns(pattern_id, pattern_key, route_id, route_seq) "
+            "VALUES (?, ?, ?, 1);",
+            (pid, f"p{pid}", route_id),
+        )
+        conn.executemany(
+            "INSERT INTO pattern_stops(pattern_id, seq, place_id) VALUES (?, ?, ?);",
+            [(pid, s, s) for s in range(1, n_stops + 1)],
+        )
+    conn.execute(
+        "INSERT INTO service_calendars VALUES (1, 20240101, 20241231, 1,1,1,1,1,0,0);"
+    )
+    conn.executemany(
+        "INSERT INTO headway_frequencies VALUES (?, ?, 1, '06:00:00', '09:00:00', ?, ?);",
+        [
+            (7, 1, 600, "t1"),
+            (8, 1, 300, "t2"),
+            (9, 1, 300, "t4"),
+            (5, 1, 300, "t5"),
+            (7, 2, 300, "t6"),
+        ],
+    )
+    # "05" and "5" normalize to the same upstream id on two routes: ambiguous.
+    mapping = [(1, "7"), (2, "8"), (1, "05"), (2, "5"), (2, "9X")]
+    pq = tmp_path / "map_route_source.parquet"
+    pl.DataFrame(
+        {
+            "source": ["td"] * len(mapping),
+            "mode": ["bus"] * len(mapping),
+            "source_route_id": [sid for _, sid in mapping],
+            "source_file": ["ROUTE_BUS.xml"] * len(mapping),
+            "source_row": list(range(len(mapping))),
+            "route_id": [rid for rid, _ in mapping],
+            "route_key": [f"bus:{rid}" for rid, _ in mapping],
+        }
+    ).write_parquet(pq)
+    load_temp_map_route_source(conn, parquet_path=pq)
+    return conn
+
+
+def test_resolve_picks_longest_pattern_with_min_id_tiebreak(tmp_path: Path) -> None:
+    conn = _mk_conn(tmp_path)
+
+    stats = resolve_pattern_headways(conn, routes_fares_source_id="td")
+
+    rows = conn.execute(
+        "SELECT pattern_id, headway_secs, sample_trip_id FROM pattern_headways "
+        "ORDER BY pattern_id;"
+    ).fetchall()
+    assert rows == [(11, 600, "t1"), (20, 300, "t2")]
+    assert stats.to_dict() == {
+        "inserted_rows": 2,
+        "unresolved_missing_route": 2,
+        "unresolved_ambiguous_route": 1,
+        "unresolved_missing_route_seq": 0,
+        "unresolved_missing_pattern": 1,
+    }
+
+
+def test_resolve_debug_table_lists_each_unresolved_row_with_reason(
+    tmp_path: Path,
+) -> None:
+    conn = _mk_conn(tmp_path)
+
+    resolve_pattern_headways(
+        conn, routes_fares_source_id="td", create_debug_tables=True
+    )
+
+    rows = conn.execute(
+        "SELECT upstream_route_id, route_seq, sample_trip_id, reason "
+        "FROM unresolved_headway_frequencies ORDER BY sample_trip_id;"
+    ).fetchall()
+    assert rows == [
+        (9, 1, "t4", "missing_upstream_route_id"),
+        (5, 1, "t5", "ambiguous_upstream_route_id"),
+        (7, 2, "t6", "missing_pattern"),
+    ]
+
+
+def test_resolve_without_source_mapping_skips_insert_but_counts(
+    tmp_path: Path,
+) -> None:
+    conn = _mk_conn(tmp_path)
+    resolve_pattern_headways(conn, routes_fares_source_id="td")
+
+    stats = resolve_pattern_headways(
+        conn, routes_fares_source_id="absent", create_debug_tables=True
+    )
+
+    assert conn.execute("SELECT COUNT(*) FROM pattern_headways;").fetchone() == (0,)
+    assert stats.inserted_rows == 0
+    assert stats.unresolved_missing_route == 5
+    assert stats.unresolved_missing_pattern == 0
+    reasons = conn.execute(
+        "SELECT DISTINCT reason FROM unresolved_headway_frequencies;"
+    ).fetchall()
+    assert reasons == [("missing_upstream_route_id",)]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import datetime as dt
+import sqlite3
+from pathlib import Path
+
+import orjson
+import polars as pl
+import pytest
+from hk_public_transport_etl.stages.commit import sql_writer
+from hk_public_transport_etl.stages.commit.config import CommitConfig
+from hk_public_transport_etl.stages.commit.ddl import load_canonical_ddl
+from hk_public_transport_etl.stages.commit.sql_writer import (
+    BuildBundleParams,
+    _apply_import_pragmas,
+    _expected_cols_and_pk,
+    _insert_table,
+    _introspect_all_tables,
+    _is_sorted_by,
+    _post_load_maintenance,
+    _read_tables_ahead,
+    build_sqlite_bundle,
+)
+
+
+def test_insert_table_coerces_columns_like_isoformat() -> None:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, ok, d, ts, tz);")
+    naive = [dt.datetime(2024, 1, 2, 3, 4, 5), dt.datetime(2024, 1, 2, 3, 4, 5, 120)]
+    aware = [x.replace(tzinfo=dt.timezone.utc) for x in naive]
+    df = pl.DataFrame(
+        {
+            "tz": aware,
+            "ts": naive,
+            "d": [dt.date(2024, 1, 2), None],
+            "ok": [True, False],
+            "id": [2, 1],
+        }
+    )
+
+    assert _insert_table(conn, "t", df, batch_rows=1) == 2
+
+    rows = conn.execute("SELECT id, ok, d, ts, tz FROM t ORDER BY id").fetchall()
+    assert rows == [
+        (1, 0, None, naive[1].isoformat(), aware[1].isoformat()),
+        (2, 1, "2024-01-02", naive[0].isoformat(), aware[0].isoformat()),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("rows", "expected"),
+    [
+        ([(1, "a"), (1, "b"), (2, "a")], True),
+        ([(1, "b"), (1, "a"), (2, "a")], False),
+        ([(2, "a"), (1, "z")], False),
+        ([(1, "a"), (1, "a")], True),
+    ],
+)
+def test_is_sorted_by_compares_keys_lexicographically(
+    rows: list[tuple[int, str]], expected: bool
+) -> None:
+    df = pl.DataFrame(rows, schema=["a", "b"], orient="row")
+
+    assert _is_sorted_by(df, ["a", "b"]) is expected
+
+
+def test_insert_table_sorts_only_when_needed(monkeypatch) -> None:
+    sorts: list[list[str]] = []
+    real_sort = pl.DataFrame.sort
+
+    def counting_sort(self, by, *args, **kw):
+        sorts.append(list(by))
+        return real_sort(self, by, *args, **kw)
+
+    monkeypatch.setattr(pl.DataFrame, "sort", counting_sort)
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE t (k TEXT PRIMARY KEY, v INTEGER) WITHOUT ROWID;")
+
+    _insert_table(conn, "t", pl.DataFrame({"k": ["a", "b"], "v": [1, 2]}), 10)
+    unsorted = pl.DataFrame({"k": ["d", "c"], "v": [3, 4]})
+    _insert_table(conn, "t", unsorted, 10, pre_sort_min_rows=10)
+    assert sorts == []
+
+    _insert_table(conn, "t", unsorted.with_columns(pl.col("k") + "2"), 10)
+    assert sorts == [["k"]]
+    assert conn.execute("SELECT count(*) FROM t").fetchone() == (6,)
+
+
+@pytest.mark.parametrize("workers", [0, 1, 3])
+def test_read_tables_ahead_yields_in_requested_order(
+    tmp_path: Path, workers: int
+) -> None:
+    inputs = {}
+    for i, name in enumerate(["c", "a", "b", "d"]):
+        inputs[name] = tmp_path / f"{name}.parquet"
+        pl.DataFrame({"x": [i]}).write_parquet(inputs[name])
+
+    got = list(_read_tables_ahead(inputs, ["a", "b", "d"], workers=workers))
+
+    assert [(n, df["x"].to_list()) for n, df in got] == [
+        ("a", [1]),
+        ("b", [2]),
+        ("d", [3]),
+    ]
+
+
+def test_introspect_all_tables_matches_per_table_pragma() -> None:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.executescript(load_canonical_ddl())
+
+    shapes = _introspect_all_tables(conn)
+
+    assert "route_patterns" in shapes and "pattern_stops" in shapes
+    for table, shape in shapes.items():
+        cols, pk_cols = _expected_cols_and_pk(conn, table)
+        assert (shape.columns, shape.pk_cols) == (cols, pk_cols)
+    assert shapes["pattern_stops"].pk_cols == ["pattern_id", "seq"]
+
+
+def test_import_pragmas_set_page_size_before_ddl(tmp_path: Path) -> None:
+    conn = sqlite3.connect(tmp_path / "b.sqlite", isolation_level=None)
+    cfg = CommitConfig(page_size_bytes=16_384)
+
+    _apply_import_pragmas(conn, cfg)
+    conn.executescript(load_canonical_ddl())
+
+    assert conn.execute("PRAGMA page_size;").fetchone() == (16_384,)
+    assert conn.execute("PRAGMA locking_mode;").fetchone() == ("exclusive",)
+    conn.close()
+
+
+def test_build_bundle_loads_tables_prepared_in_decode_workers(tmp_path: Path) -> None:
+    ops = tmp_path / "operators.parquet"
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(load_canonical_ddl())
+    cols, _ = _expected_cols_and_pk(conn, "operators")
+    conn.close()
+    rows = {c: [None, None] for c in cols}
+    rows["operator_id"] = ["operator:KMB", "operator:CTB"]
+    rows["operator_name_en"] = ["KMB", "CTB"]
+    pl.DataFrame(rows, schema={c: pl.Utf8 for c in cols}).write_parquet(ops)
+    out = tmp_path / "bundle" / "canonical.sqlite"
+
+    meta = build_sqlite_bundle(
+        BuildBundleParams(
+            table_inputs={"operators": ops},
+            validation_reports={},
+            ddl_sql=load_canonical_ddl(),
+            schema_version=1,
+            out_path=out,
+            bundle_id="b",
+            bundle_version="v",
+            headway_mode="none",
+        )
+    )
+
+    assert meta["row_counts"] == {"operators": 2}
+    assert set(meta["pragmas"]) == {
+        "journal_mode",
+        "synchronous",
+        "foreign_keys",
+        "cache_size",
+        "page_size",
+        "user_version",
+    }
+    assert meta["schema_version"] == meta["pragmas"]["user_version"]
+    got = sqlite3.connect(out).execute("SELECT operator_id FROM operators").fetchall()
+    assert got == [("operator:CTB",), ("operator:KMB",)]
+
+
+def test_build_bundle_hashes_each_validation_report_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    reports = {}
+    for sid in ("b_src", "a_src"):
+        reports[sid] = tmp_path / f"{sid}.json"
+        reports[sid].write_text(f'{{"source": "{sid}"}}')
+    hashed: list[Path] = []
+    real = sql_writer.sha256_file
+
+    def counting(p: Path):
+        hashed.append(p)
+        return real(p)
+
+    monkeypatch.setattr(sql_writer, "sha256_file", counting)
+    out = tmp_path / "bundle" / "canonical.sqlite"
+
+    meta = build_sqlite_bundle(
+        BuildBundleParams(
+            table_inputs={},
+            validation_reports=reports,
+            ddl_sql=load_canonical_ddl(),
+            schema_version=1,
+            out_path=out,
+            bundle_id="b",
+            bundle_version="v",
+            headway_mode="none",
+        )
+    )
+
+    assert sorted(hashed) == sorted(reports.values())
+    digests = meta["inputs"]["validation_reports_sha256"]
+    assert list(digests) == ["a_src", "b_src"]
+    assert digests["a_src"] == real(reports["a_src"]).sha256
+    (notes,) = sqlite3.connect(out).execute("SELECT notes FROM meta").fetchone()
+    assert orjson.loads(notes)["validation_reports_sha256"] == digests
+
+
+@pytest.mark.parametrize("limit", [0, 50])
+def test_post_load_analyze_honours_analysis_limit(limit: int) -> None:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT);")
+    conn.execute("CREATE INDEX t_v ON t(v);")
+    conn.executemany(
+        "INSERT INTO t VALUES (?, ?);", [(i, str(i % 7)) for i in range(500)]
+    )
+
+    _post_load_maintenance(conn, CommitConfig(run_analyze=True, analysis_limit=limit))
+
+    assert conn.execute("PRAGMA analysis_limit;").fetchone() == (limit,)
+    assert conn.execute("SELECT count(*) FROM sqlite_stat1").fetchone()[0] > 0
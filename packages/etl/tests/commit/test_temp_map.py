@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import polars as pl
+import pytest
+from hk_public_transport_etl.stages.commit.resolvers import load_temp_map_route_source
+
+
+def _write_map(path: Path, n: int) -> None:
+    data = {
+        "source": ["td"] * n,
+        "mode": ["bus"] * n,
+        "source_route_id": [str(i) for i in range(n)],
+        "source_file": ["ROUTE_BUS.xml"] * n,
+        "source_row": list(range(n)),
+        "route_id": list(range(100, 100 + n)),
+        "route_key": [f"k{i}" for i in range(n)],
+        "unused": [0.5] * n,
+    }
+    pl.DataFrame(data).write_parquet(path)
+
+
+def test_load_temp_map_streams_rows_in_one_transaction(tmp_path: Path) -> None:
+    pq = tmp_path / "map_route_source.parquet"
+    _write_map(pq, 50)
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+
+    stats = load_temp_map_route_source(conn, parquet_path=pq)
+
+    assert stats.rows == 50
+    assert conn.execute(
+        "SELECT count(*), max(route_id) FROM temp.map_route_source"
+    ).fetchone() == (50, 149)
+    assert sum(s.strip() == "BEGIN;" for s in statements) == 1
+    assert not conn.in_transaction
+
+
+def test_load_temp_map_reports_missing_columns(tmp_path: Path) -> None:
+    pq = tmp_path / "bad.parquet"
+    pl.DataFrame({"source": ["td"]}).write_parquet(pq)
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+
+    with pytest.raises(ValueError, match="missing columns"):
+        load_temp_map_route_source(conn, parquet_path=pq)
+
+
+def test_load_temp_map_normalizes_all_digit_route_ids(tmp_path: Path) -> None:
+    pq = tmp_path / "map_route_source.parquet"
+    _write_map(pq, 5)
+    df = pl.read_parquet(pq).with_columns(
+        pl.Series("source_route_id", ["007", "000", "12A", "", "42"])
+    )
+    df.write_parquet(pq)
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+
+    load_temp_map_route_source(conn, parquet_path=pq)
+
+    got = conn.execute(
+        "SELECT source_route_id, upstream_route_id FROM temp.map_route_source "
+        "ORDER BY source_row;"
+    ).fetchall()
+    assert got == [("007", 7), ("000", 0), ("12A", None), ("", None), ("42", 42)]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import errno
 import os
 from pathlib import Path
 
+import pytest
 from hk_public_transport_etl.core import fs
 
 
@@ -33,3 +35,111 @@ def test_relpath_size_and_copy_or_hardlink(tmp_path: Path) -> None:
     # Prefer hardlink when available; fall back to copy otherwise.
     same_inode = os.stat(src).st_ino == os.stat(dst).st_ino
     assert same_inode or dst.read_text() == src.read_text()
+
+
+def test_atomic_dir_commit_swaps_in_staged_files(tmp_path: Path, monkeypatch) -> None:
+    final_dir = tmp_path / "published"
+    tmp_dir = fs.make_tmp_dir_for(final_dir)
+    for name in ("a.txt", "b.txt", "nested/c.txt"):
+        fs.ensure_parent(tmp_dir / name)
+        (tmp_dir / name).write_text(name)
+
+    synced: list[list[object]] = []
+    monkeypatch.setattr(fs, "fsync_many", lambda paths: synced.append(list(paths)))
+    fs.atomic_dir_commit(
+        tmp_dir=tmp_dir, final_dir=final_dir, fsync_paths=[tmp_dir / "a.txt"]
+    )
+    assert synced == [[tmp_dir / "a.txt"]]
+    assert (final_dir / "nested" / "c.txt").read_text() == "nested/c.txt"
+    assert not tmp_dir.exists()
+
+
+def test_copy_or_hardlink_falls_back_to_copy(tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"x" * 100_000)
+
+    def no_link(*_a, **_k):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(fs.os, "link", no_link)
+    dst = tmp_path / "out" / "dst.bin"
+    fs.copy_or_hardlink(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert os.stat(src).st_ino != os.stat(dst).st_ino
+
+
+def test_copy_or_hardlink_falls_back_when_copy_file_range_stalls(
+    tmp_path: Path, monkeypatch
+) -> None:
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"y" * 4096)
+
+    def no_link(*_a, **_k):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(fs.os, "link", no_link)
+    monkeypatch.setattr(fs.os, "copy_file_range", lambda *_a: 0, raising=False)
+    dst = tmp_path / "out" / "dst.bin"
+    fs.copy_or_hardlink(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_atomic_write_many_writes_all_and_leaves_no_temps(tmp_path: Path) -> None:
+    items = {
+        tmp_path / "a.bin": b"alpha",
+        tmp_path / "sub" / "b.txt": b"beta\n",
+    }
+    fs.atomic_write_many(items)
+
+    for p, data in items.items():
+        assert p.read_bytes() == data
+    assert not [p for p in tmp_path.rglob("*.tmp")]
+
+
+def test_atomic_write_bytes_drops_cache_only_for_large_files(
+    tmp_path: Path, monkeypatch
+) -> None:
+    dropped: list[int] = []
+    monkeypatch.setattr(fs, "drop_page_cache", dropped.append)
+    monkeypatch.setattr(fs, "_DROP_CACHE_MIN_BYTES", 10)
+
+    fs.atomic_write_bytes(tmp_path / "small.bin", b"x" * 9)
+    assert dropped == []
+    fs.atomic_write_bytes(tmp_path / "large.bin", b"x" * 10)
+    assert len(dropped) == 1
+
+
+def test_atomic_write_many_replaces_nothing_when_fsync_fails(
+    tmp_path: Path, monkeypatch
+) -> None:
+    (tmp_path / "a.bin").write_bytes(b"old")
+
+    def failing_fsync(_fd: int) -> None:
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(fs.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        fs.atomic_write_many({tmp_path / "a.bin": b"new", tmp_path / "b.bin": b"b"})
+
+    assert (tmp_path / "a.bin").read_bytes() == b"old"
+    assert not (tmp_path / "b.bin").exists()
+    assert not [p for p in tmp_path.rglob("*.tmp")]
+
+
+def test_atomic_dir_commit_does_not_swap_when_fsync_fails(
+    tmp_path: Path, monkeypatch
+) -> None:
+    final_dir = tmp_path / "published"
+    tmp_dir = fs.make_tmp_dir_for(final_dir)
+    (tmp_dir / "app.sqlite").write_bytes(b"db")
+
+    def failing_fsync(_fd: int) -> None:
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(fs.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        fs.atomic_dir_commit(
+            tmp_dir=tmp_dir, final_dir=final_dir, fsync_paths=[tmp_dir / "app.sqlite"]
+        )
+    assert not final_dir.exists()
+    assert (tmp_dir / "app.sqlite").exists()
@@ -27,6 +27,25 @@ def test_json_helpers(tmp_path: Path) -> None:
     out = tmp_path / "sample.json"
     json.atomic_write_json(out, obj)
     assert json.read_json(out) == {"a": 2, "b": 1}
+    assert json.read_json(str(out)) == {"a": 2, "b": 1}
 
     compact = json.stable_json_dumps(obj, indent=None)
     assert compact == '{"a":2,"b":1}'
+
+
+def test_stable_json_dumps_matches_stdlib_layout() -> None:
+    import json as std_json
+
+    obj = {"b": [1, {"z": "中環", "a": None}], "a": {}, "c": 1.5}
+    assert json.stable_json_dumps(obj) == std_json.dumps(
+        obj, sort_keys=True, ensure_ascii=False, indent=2
+    )
+
+
+def test_sha256_file_streams_large_files(tmp_path: Path) -> None:
+    data = bytes(range(256)) * (hashing.SINGLE_SHOT_THRESHOLD // 256 + 1000)
+    f = tmp_path / "big.bin"
+    f.write_bytes(data)
+    digest = hashing.sha256_file(f)
+    assert digest.bytes == len(data)
+    assert digest.sha256 == hashing.sha256_bytes(data)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+from hk_public_transport_etl.core import parquet
+
+
+def test_table_meta_from_parquet_matches_df_meta(tmp_path: Path) -> None:
+    df = pl.DataFrame(
+        {
+            "id": [1, 2, None],
+            "name": ["a", "b", "c"],
+            "stops": [[1], [2, 3], []],
+            "kind": pl.Series(["x", "y", "x"], dtype=pl.Categorical),
+        }
+    )
+    out = tmp_path / "t.parquet"
+    parquet.write_parquet_atomic(df, out)
+
+    expected = parquet.table_meta_from_df(out, parquet.read_parquet_df(out))
+    assert parquet.table_meta_from_parquet(out) == expected
+
+
+def test_schema_fingerprint_is_64_hex_and_order_sensitive() -> None:
+    a = pl.DataFrame({"x": [1], "y": ["a"]}).to_arrow().schema
+    b = pl.DataFrame({"y": ["a"], "x": [1]}).to_arrow().schema
+    fp = parquet.schema_fingerprint(a)
+    assert len(fp) == 64 and int(fp, 16) >= 0
+    assert fp == parquet.schema_fingerprint(a)
+    assert fp != parquet.schema_fingerprint(b)
+
+
+def test_schema_fingerprint_is_cached_for_equal_schemas() -> None:
+    parquet.schema_fingerprint.cache_clear()
+    a = pl.DataFrame({"x": [1]}).to_arrow().schema
+    b = pl.DataFrame({"x": [2]}).to_arrow().schema
+    assert parquet.schema_fingerprint(a) == parquet.schema_fingerprint(b)
+    assert parquet.schema_fingerprint.cache_info().hits == 1
+
+
+def test_write_parquet_atomic_durability_controls_fsync(
+    tmp_path: Path, monkeypatch
+) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(parquet, "fsync_file", lambda p: calls.append("file"))
+    monkeypatch.setattr(parquet, "fsync_dir", lambda p: calls.append("dir"))
+    df = pl.DataFrame({"x": [1, 2]})
+
+    for durability, expected in (
+        ("none", []),
+        ("data", ["file"]),
+        ("full", ["file", "dir"]),
+    ):
+        calls.clear()
+        out = tmp_path / f"{durability}.parquet"
+        parquet.write_parquet_atomic(df, out, durability=durability)
+        assert calls == expected
+        assert parquet.read_parquet_df(out).equals(df)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import platform
+import shutil
+from datetime import datetime, timezone
 from pathlib import Path
 
 from hk_public_transport_etl.core import errors, paths, provenance, time
@@ -13,6 +16,21 @@ def test_datalayout_paths_and_dirs(tmp_path: Path) -> None:
     layout.ensure_dirs("src", "v1")
     assert (tmp_path / "normalized" / "src" / "v1").is_dir()
     assert (tmp_path / "out" / "src" / "v1").is_dir()
+    assert (tmp_path / "normalized" / "src" / "v1" / "unresolved").is_dir()
+
+    # Directories removed between calls are recreated.
+    shutil.rmtree(tmp_path / "out")
+    layout.ensure_dirs("src", "v1")
+    assert (tmp_path / "out" / "src" / "v1").is_dir()
+
+
+def test_datalayout_for_version_is_cached_and_consistent(tmp_path: Path) -> None:
+    layout = paths.DataLayout(root=tmp_path)
+    v = layout.for_version("src", "v1")
+    assert v is layout.for_version("src", "v1")
+    assert v.normalized_tables == tmp_path / "normalized" / "src" / "v1" / "tables"
+    assert layout.published("src", "v1") == layout.published_root() / "src" / "v1"
+    assert layout.raw_artifacts("src", "v1") == v.raw / "artifacts"
 
 
 def test_stage_error_and_run_id() -> None:
@@ -28,12 +46,27 @@ def test_stage_error_and_run_id() -> None:
     assert rid1 != rid2 and len(rid1) == 32
 
 
+def test_run_provenance_host_fields() -> None:
+    a = provenance.RunProvenance(run_id="r", started_at_utc="t")
+    b = provenance.RunProvenance(run_id="r", started_at_utc="t")
+    assert a == b
+    assert a.python == platform.python_version() and a.platform
+    assert provenance._platform.cache_info().hits >= 1
+
+
 def test_timer_records_duration() -> None:
     with provenance.Timer() as t:
         pass
     assert t.duration_ms is not None and t.duration_ms >= 0
+    assert t.duration_ns is not None and t.duration_ms == t.duration_ns // 1_000_000
 
 
 def test_time_helpers_format() -> None:
-    assert time.utc_now_iso().endswith("Z")
+    now = time.utc_now_iso()
+    assert now.endswith("Z") and len(now) == len("2024-01-01T00:00:00.000000Z")
+    parsed = datetime.fromisoformat(now.replace("Z", "+00:00"))
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
     assert len(time.today_version().split("-")) == 3
+    assert time.utc_iso_from_ns(1_700_000_000_123_456_789) == (
+        "2023-11-14T22:13:20.123456Z"
+    )
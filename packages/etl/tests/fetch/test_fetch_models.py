@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from hk_public_transport_etl.stages.fetch.models import (
+    RawMetadata,
+    RawMetadataArtifact,
+)
+
+
+def _artifact(endpoint_id: str, status_code: int = 200) -> RawMetadataArtifact:
+    return RawMetadataArtifact(
+        endpoint_id=endpoint_id,
+        bytes=1,
+        filename=f"{endpoint_id}.csv",
+        uri="https://example.com/",
+        final_url="https://example.com/",
+        path=f"artifacts/{endpoint_id}.csv",
+        retrieved_at_utc="2024-01-01T00:00:00Z",
+        sha256="0" * 64,
+        status_code=status_code,
+    )
+
+
+def test_upsert_artifact_replaces_in_place_and_appends_new() -> None:
+    meta = RawMetadata(
+        source_id="src",
+        version="v1",
+        created_at_utc="t",
+        updated_at_utc="t",
+        artifacts=[_artifact("ep_a"), _artifact("ep_b")],
+    )
+
+    meta.upsert_artifact(_artifact("ep_a", status_code=304))
+    meta.upsert_artifact(_artifact("ep_c"))
+
+    assert [a.endpoint_id for a in meta.artifacts] == ["ep_a", "ep_b", "ep_c"]
+    assert meta.artifacts[0].status_code == 304
+    assert meta.get_artifact("ep_a") is meta.artifacts[0]
+    assert list(meta.by_endpoint()) == ["ep_a", "ep_b", "ep_c"]
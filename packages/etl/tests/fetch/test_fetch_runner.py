@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+from hk_public_transport_etl.core.paths import DataLayout
+from hk_public_transport_etl.registry.models import SourceSpec
+from hk_public_transport_etl.stages.fetch.http import make_http_client
+from hk_public_transport_etl.stages.fetch.models import RawMetadata
+from hk_public_transport_etl.stages.fetch.runner import StageFetchError, fetch_source
+
+
+def _spec(endpoints: list[dict]) -> SourceSpec:
+    return SourceSpec.model_validate(
+        {
+            "spec_version": 1,
+            "id": "demo_src",
+            "authority": "x",
+            "title": "x",
+            "dataset": {
+                "dataset_id": "demo",
+                "dataset_url": "https://example.com/",
+                "provider": "x",
+            },
+            "base_urls": [{"name": "a", "url": "https://a.example.com/"}],
+            "endpoints": [{"title": "x", "format": "csv", **ep} for ep in endpoints],
+        }
+    )
+
+
+def _client() -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    return make_http_client(transport=httpx.MockTransport(handler), http2=False)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_fetch_source_commits_endpoints_in_order(
+    tmp_path: Path, max_workers: int
+) -> None:
+    spec = _spec(
+        [
+            {"id": "ep_b", "path": "/b.csv"},
+            {"id": "gone", "path": "/missing.csv", "required": False},
+            {"id": "ep_a", "path": "/a.csv"},
+        ]
+    )
+    layout = DataLayout(root=tmp_path)
+
+    with _client() as client:
+        res = fetch_source(
+            spec=spec,
+            version="v1",
+            layout=layout,
+            client=client,
+            max_attempts=1,
+            max_workers=max_workers,
+        )
+
+    assert [a.endpoint_id for a in res.artifacts] == ["ep_b", "ep_a"]
+    assert Path(res.artifacts[1].path).read_bytes() == b"/a.csv"
+    assert not any((layout.raw("demo_src", "v1") / ".tmp").iterdir())
+
+
+def test_fetch_source_discards_downloads_after_required_failure(
+    tmp_path: Path,
+) -> None:
+    spec = _spec(
+        [
+            {"id": "gone", "path": "/missing.csv"},
+            {"id": "ep_a", "path": "/a.csv"},
+        ]
+    )
+    layout = DataLayout(root=tmp_path)
+
+    with _client() as client, pytest.raises(StageFetchError):
+        fetch_source(
+            spec=spec, version="v1", layout=layout, client=client, max_attempts=1
+        )
+
+    version_root = layout.raw("demo_src", "v1")
+    assert not any((version_root / ".tmp").iterdir())
+    assert not any(layout.raw_artifacts("demo_src", "v1").iterdir())
+
+
+def test_fetch_source_metadata_round_trips_through_validation(
+    tmp_path: Path,
+) -> None:
+    layout = DataLayout(root=tmp_path)
+
+    with _client() as client:
+        res = fetch_source(
+            spec=_spec([{"id": "ep_a", "path": "/a.csv"}]),
+            version="v1",
+            layout=layout,
+            client=client,
+        )
+
+    meta = RawMetadata.model_validate_json(
+        Path(res.raw_metadata_path).read_text(encoding="utf-8")
+    )
+    (entry,) = meta.artifacts
+    assert entry.sha256 == res.artifacts[0].sha256
+    assert entry.path == "artifacts/a.csv"
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+from hk_public_transport_etl.registry import EndpointSpec
+from hk_public_transport_etl.stages.fetch.filename import (
+    cd_filename,
+    resolve_artifact_filename,
+    sanitize,
+)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ('attachment; FILENAME="routes.zip"', "routes.zip"),
+        ("attachment; filename=stops.csv; size=10", "stops.csv"),
+        ("inline", None),
+        (None, None),
+    ],
+)
+def test_cd_filename(header: str | None, expected: str | None) -> None:
+    assert cd_filename(header) == expected
+
+
+def test_sanitize_collapses_unsafe_runs() -> None:
+    assert sanitize("/巴士 路線 (2024).zip/") == "_2024_.zip"
+    assert sanitize("  / ") == "artifact"
+
+
+def test_resolve_artifact_filename_suffixes_collisions() -> None:
+    endpoint = EndpointSpec(
+        id="routes", title="t", format="zip", path="x", filename="routes.zip"
+    )
+    used = {"routes_2.zip": 2}
+
+    names = [
+        resolve_artifact_filename(
+            endpoint=endpoint, uri="", response_headers={}, used_names=used
+        )
+        for _ in range(4)
+    ]
+
+    assert names == ["routes.zip", "routes_3.zip", "routes_4.zip", "routes_5.zip"]
+
+
+def test_resolve_artifact_filename_falls_back_to_last_uri_segment() -> None:
+    endpoint = EndpointSpec(id="stops", title="t", format="csv", path="x")
+
+    name = resolve_artifact_filename(
+        endpoint=endpoint,
+        uri="https://example.com/a/b/stops.csv/",
+        response_headers={"Content-Disposition": None},
+        used_names={},
+    )
+
+    assert name == "stops.csv"
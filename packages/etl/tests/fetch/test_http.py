@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from hk_public_transport_etl.stages.fetch import http
+from hk_public_transport_etl.stages.fetch.http import (
+    DeterministicExponentialBackoff,
+    RetryableHttpStatus,
+    make_http_client,
+    parse_retry_after,
+    stream_get_to_file_with_retries,
+)
+
+
+def test_stream_get_batches_chunks_into_writev(tmp_path: Path, monkeypatch) -> None:
+    body = os.urandom(300_000)
+    client = make_http_client(
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, content=body)),
+        http2=False,
+    )
+    calls: list[int] = []
+    real = os.writev
+
+    def counting(fd: int, bufs) -> int:
+        calls.append(len(bufs))
+        return real(fd, bufs)
+
+    monkeypatch.setattr(http.os, "writev", counting)
+    monkeypatch.setattr(http, "_WRITEV_FLUSH_BYTES", 100_000)
+    dest = tmp_path / "out.part"
+
+    with client:
+        res = stream_get_to_file_with_retries(
+            client, url="https://x.example/a", dest_path=dest, chunk_bytes=32_768
+        )
+
+    assert res.bytes_written == len(body)
+    assert dest.read_bytes() == body
+    assert calls == [4, 4, 2]
+    assert res.sha256 == hashlib.sha256(body).hexdigest()
+
+
+def test_stream_get_drops_page_cache_only_for_large_bodies(
+    tmp_path: Path, monkeypatch
+) -> None:
+    dropped: list[int] = []
+    monkeypatch.setattr(http, "drop_page_cache", dropped.append)
+    monkeypatch.setattr(http, "_DROP_CACHE_MIN_BYTES", 10)
+    client = make_http_client(
+        transport=httpx.MockTransport(
+            lambda r: httpx.Response(200, content=r.url.path.encode())
+        ),
+        http2=False,
+    )
+
+    with client:
+        for path in ("/tiny", "/large-enough"):
+            stream_get_to_file_with_retries(
+                client, url=f"https://x.example{path}", dest_path=tmp_path / "o"
+            )
+
+    assert len(dropped) == 1
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("30", 30.0),
+        ("Wed, 01 Jan 2025 00:00:10 GMT", 5.0),
+        ("Wed, 01 Jan 2025 00:00:00 GMT", 0.0),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(header: str | None, expected: float | None) -> None:
+    now = dt.datetime(2025, 1, 1, 0, 0, 5, tzinfo=dt.timezone.utc)
+    assert parse_retry_after(header, now=now) == expected
+
+
+def test_backoff_honours_retry_after_up_to_its_cap() -> None:
+    backoff = DeterministicExponentialBackoff(base=0.5, cap=4.0, retry_after_cap=60.0)
+
+    def state(exc: BaseException, attempt: int = 2) -> SimpleNamespace:
+        outcome = SimpleNamespace(failed=True, exception=lambda: exc)
+        return SimpleNamespace(outcome=outcome, attempt_number=attempt)
+
+    def status(retry_after: float | None) -> RetryableHttpStatus:
+        return RetryableHttpStatus(
+            method="GET", url="u", status_code=429, retry_after=retry_after
+        )
+
+    assert backoff(state(status(30.0))) == 30.0
+    assert backoff(state(status(600.0))) == 60.0
+    assert backoff(state(status(None), attempt=3)) == 1.0
+    assert backoff(state(httpx.ConnectError("x"), attempt=9)) == 4.0
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from hk_public_transport_etl.core import get_logger, sha256_file
+from hk_public_transport_etl.pipeline import context as context_mod
+from hk_public_transport_etl.pipeline.context import RunContext
+from hk_public_transport_etl.pipeline.events import EventSink
+
+
+def _ctx(tmp_path: Path) -> RunContext:
+    return RunContext(
+        run_id="r1",
+        run_root=tmp_path / "run",
+        data_root=tmp_path / "data",
+        logger=get_logger("test"),
+        events=EventSink(tmp_path / "run" / "events.jsonl"),
+    )
+
+
+def test_record_artifact_reuses_digest_for_unchanged_file(
+    tmp_path: Path, monkeypatch
+) -> None:
+    ctx = _ctx(tmp_path)
+    f = tmp_path / "data" / "t.parquet"
+    f.parent.mkdir(parents=True)
+    f.write_bytes(b"abc")
+
+    calls: list[int] = []
+    real = context_mod.sha256_fileobj
+
+    def counting(fobj, size: int):
+        calls.append(size)
+        return real(fobj, size)
+
+    monkeypatch.setattr(context_mod, "sha256_fileobj", counting)
+
+    a1 = ctx.record_artifact(stage="s", path=f, rel_to=tmp_path)
+    a2 = ctx.record_artifact(stage="s", path=f, rel_to=tmp_path)
+    assert a1 == a2
+    assert a1.path == "data/t.parquet" and a1.bytes == 3
+    assert len(calls) == 1
+    assert a1.sha256 == sha256_file(f).sha256
+
+    # Same size and mtime, but atomically replaced: a new inode forces a rehash.
+    st = f.stat()
+    tmp = f.with_suffix(".tmp")
+    tmp.write_bytes(b"xyz")
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, f)
+    a3 = ctx.record_artifact(stage="s", path=f, rel_to=tmp_path)
+    assert len(calls) == 2
+    assert a3.sha256 == sha256_file(f).sha256 != a1.sha256
+    ctx.events.close()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import orjson
+import pytest
+from hk_public_transport_etl.pipeline import events
+from hk_public_transport_etl.pipeline.events import (
+    EventSink,
+    EventType,
+    event_wire,
+    make_event,
+)
+
+
+def test_event_sink_writes_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "run" / "events.jsonl"
+    sink = EventSink(path, flush_every=8)
+    sink.emit(make_event(event_type=EventType.RUN_START, run_id="r1", mode="full"))
+    sink.emit(make_event(event_type="custom.event", run_id="r1", stage="fetch"))
+    sink.close()
+    sink.close()
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["type"] for r in rows] == ["run.env", "run.start", "custom.event"]
+    assert rows[1]["data"] == {"mode": "full"}
+    assert rows[2]["stage"] == "fetch"
+
+
+def test_event_sink_flushes_every_n_events(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = EventSink(path, flush_every=2)
+    sink.emit(make_event(event_type=EventType.RUN_START, run_id="r1"))
+    assert len(path.read_bytes().splitlines()) == 2
+    sink.emit(make_event(event_type=EventType.RUN_FINISH, run_id="r1"))
+    sink.close()
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["type"] for r in rows] == ["run.env", "run.start", "run.finish"]
+
+
+def test_event_sink_emit_after_close_raises(tmp_path: Path) -> None:
+    sink = EventSink(tmp_path / "events.jsonl")
+    sink.close()
+    with pytest.raises(ValueError):
+        sink.emit(make_event(event_type=EventType.RUN_FINISH, run_id="r1"))
+
+
+def test_event_wire_maps_members_and_passes_strings_through() -> None:
+    assert event_wire(EventType.STAGE_START) == "stage.start"
+    assert event_wire("stage.start") == "stage.start"
+    assert event_wire("custom.event") == "custom.event"
+
+
+def test_encode_event_matches_generic_encoding() -> None:
+    for ev in (
+        make_event(event_type=EventType.STAGE_START, run_id="r1", stage="fetch"),
+        make_event(event_type="custom.中", run_id='q"1', n=1, nested={1: [2]}),
+    ):
+        generic = orjson.dumps(
+            {
+                "type": ev.type,
+                "ts_utc": ev.ts_utc,
+                "run_id": ev.run_id,
+                "stage": ev.stage,
+                "data": ev.data,
+            },
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+        assert events._encode_event(ev) == generic
+
+
+def test_make_event_preencodes_data() -> None:
+    ev = make_event(event_type=EventType.STAGE_METRICS, run_id="r1", rows=3)
+    assert ev.data_json == b'{"rows":3}'
+    assert orjson.loads(events._encode_event(ev))["data"] == {"rows": 3}
+    assert make_event(event_type=EventType.RUN_FINISH, run_id="r1").data_json is None
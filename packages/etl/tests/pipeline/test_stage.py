@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from hk_public_transport_etl.pipeline.context import RunContext
+from hk_public_transport_etl.pipeline.events import EventSink
+from hk_public_transport_etl.pipeline.report import build_run_report
+from hk_public_transport_etl.pipeline.stage import FunctionStage, run_stage
+
+
+class _RecordingLogger:
+    def __init__(self) -> None:
+        self.records: list[tuple[str, str, dict[str, Any]]] = []
+
+    def _log(self, level: str, event: str, **kw: Any) -> None:
+        self.records.append((level, event, kw))
+
+    def debug(self, event: str, **kw: Any) -> None:
+        self._log("debug", event, **kw)
+
+    def info(self, event: str, **kw: Any) -> None:
+        self._log("info", event, **kw)
+
+    def warning(self, event: str, **kw: Any) -> None:
+        self._log("warning", event, **kw)
+
+    def error(self, event: str, **kw: Any) -> None:
+        self._log("error", event, **kw)
+
+    def exception(self, event: str, **kw: Any) -> None:
+        self._log("exception", event, **kw)
+
+    def bind(self, **kw: Any) -> "_RecordingLogger":
+        return self
+
+
+def test_run_stage_logs_one_debug_record_per_lifecycle_event(
+    tmp_path: Path,
+) -> None:
+    logger = _RecordingLogger()
+    sink = EventSink(tmp_path / "events.jsonl")
+    ctx = RunContext(
+        run_id="r1",
+        run_root=tmp_path,
+        data_root=tmp_path,
+        logger=logger,
+        events=sink,
+    )
+    stage = FunctionStage(
+        "demo", lambda c: {"_warnings": ["a", "b"], "_metrics": {"n": 1}, "x": 1}
+    )
+
+    res = run_stage(ctx=ctx, stage=stage)
+    sink.close()
+
+    assert res.status == "success" and res.warnings == ("a", "b")
+    events = [kw["event_type"] for lvl, _, kw in logger.records if lvl == "debug"]
+    assert events == [
+        "stage.start",
+        "stage.warn",
+        "stage.warn",
+        "stage.metrics",
+        "stage.success",
+    ]
+    warns = [r for r in logger.records if r[0] == "warning"]
+    assert len(warns) == 1 and warns[0][2]["items"] == ["a", "b"]
+
+
+def test_failed_stage_reports_chained_traceback(tmp_path: Path) -> None:
+    sink = EventSink(tmp_path / "events.jsonl")
+    ctx = RunContext(
+        run_id="r1",
+        run_root=tmp_path,
+        data_root=tmp_path,
+        logger=_RecordingLogger(),
+        events=sink,
+    )
+
+    def boom(c: RunContext) -> None:
+        try:
+            {}["missing"]
+        except KeyError as e:
+            raise ValueError("bad input") from e
+
+    res = run_stage(ctx=ctx, stage=FunctionStage("demo", boom))
+    sink.close()
+
+    assert res.status == "failed" and res.error is not None
+    assert isinstance(res.error.traceback, str)
+
+    report = build_run_report(
+        run_id="r1",
+        started_at_utc="t0",
+        finished_at_utc="t1",
+        duration_ms=1,
+        stage_results=[res],
+        events_jsonl=None,
+    ).to_dict()
+    err = report["stages"][0]["error"]
+    assert err["exc_type"] == "ValueError" and err["message"] == "bad input"
+    assert "in boom" in err["traceback"]
+    assert "KeyError: 'missing'" in err["traceback"]
+    assert "direct cause of the following exception" in err["traceback"]
+    assert err["traceback"].endswith("ValueError: bad input\n")
+
+
+def test_run_stage_skips_info_and_debug_work_when_disabled(tmp_path: Path) -> None:
+    class _WarnOnly(_RecordingLogger):
+        def is_enabled_for(self, level: int) -> bool:
+            return level >= logging.WARNING
+
+    logger = _WarnOnly()
+    sink = EventSink(tmp_path / "events.jsonl")
+    ctx = RunContext(
+        run_id="r1", run_root=tmp_path, data_root=tmp_path, logger=logger, events=sink
+    )
+
+    res = run_stage(ctx=ctx, stage=FunctionStage("demo", lambda c: {"x": 1}))
+    sink.close()
+
+    assert res.status == "success"
+    assert logger.records == []
+
+
+def test_failed_stage_logs_events_as_they_happen(tmp_path: Path) -> None:
+    logger = _RecordingLogger()
+    sink = EventSink(tmp_path / "events.jsonl")
+    ctx = RunContext(
+        run_id="r1", run_root=tmp_path, data_root=tmp_path, logger=logger, events=sink
+    )
+    f = tmp_path / "out.bin"
+    f.write_bytes(b"x")
+
+    def record_then_fail(c: RunContext) -> None:
+        c.record_artifact(stage="demo", path=f, rel_to=tmp_path)
+        raise RuntimeError("late failure")
+
+    run_stage(ctx=ctx, stage=FunctionStage("demo", record_then_fail))
+    sink.close()
+
+    debug = [(ev, kw["event_type"]) for lvl, ev, kw in logger.records if lvl == "debug"]
+    assert debug == [
+        ("stage.start", "stage.start"),
+        ("artifact.written", "artifact.written"),
+        ("stage.failed", "stage.failed"),
+    ]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pydantic
+import pytest
+from hk_public_transport_etl.registry import loader
+from hk_public_transport_etl.registry.models import BaseURL, EndpointSpec, SourceSpec
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+
+def test_get_source_registry_reuses_until_config_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    cfg = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, cfg)
+
+    calls: list[Path] = []
+    real = loader.load_registry
+
+    def counting(config_dir: Path):
+        calls.append(config_dir)
+        return real(config_dir)
+
+    monkeypatch.setattr(loader, "load_registry", counting)
+
+    first = loader.get_source_registry(cfg)
+    second = loader.get_source_registry(cfg)
+    assert first == second and first is not second
+    assert len(first) == 3
+    assert len(calls) == 1
+
+    spec = next((cfg / "sources").glob("*.json"))
+    st = spec.stat()
+    os.utime(spec, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    loader.get_source_registry(cfg)
+    assert len(calls) == 2
+
+
+def test_load_registry_rejects_invalid_spec(tmp_path: Path) -> None:
+    cfg = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, cfg)
+    spec = next((cfg / "sources").glob("*.json"))
+    spec.write_text('{"id": 1}')
+
+    with pytest.raises(pydantic.ValidationError):
+        loader.load_registry(cfg)
+
+
+def test_source_spec_url_candidates_match_unsorted_resolution() -> None:
+    spec = SourceSpec.model_validate(
+        {
+            "spec_version": 1,
+            "id": "demo_src",
+            "authority": "x",
+            "title": "x",
+            "dataset": {
+                "dataset_id": "demo",
+                "dataset_url": "https://example.com/",
+                "provider": "x",
+            },
+            "base_urls": [
+                {"name": "b", "url": "https://b.example.com/root", "priority": 2},
+                {"name": "a", "url": "https://a.example.com/", "priority": 1},
+            ],
+            "endpoints": [
+                {"id": "ep1", "title": "x", "path": "/data.csv", "format": "csv"}
+            ],
+        }
+    )
+    ep = spec.endpoint_map["ep1"]
+    expected = [
+        "https://a.example.com/data.csv",
+        "https://b.example.com/root/data.csv",
+    ]
+    assert ep.resolved_url_candidates(spec.base_urls) == expected
+    assert spec.url_candidates(ep) == expected
+    assert spec.url_candidates(ep) is not spec.url_candidates(ep)
+
+
+def test_source_spec_url_memo_follows_model_copy() -> None:
+    spec = SourceSpec.model_validate(
+        {
+            "spec_version": 1,
+            "id": "demo_src",
+            "authority": "x",
+            "title": "x",
+            "dataset": {
+                "dataset_id": "demo",
+                "dataset_url": "https://example.com/",
+                "provider": "x",
+            },
+            "base_urls": [{"name": "a", "url": "https://a.example.com/"}],
+            "endpoints": [
+                {"id": "ep1", "title": "x", "path": "f.csv", "format": "csv"}
+            ],
+        }
+    )
+    ep = spec.endpoint_map["ep1"]
+    assert spec.url_candidates(ep) == ["https://a.example.com/f.csv"]
+
+    b = BaseURL(name="b", url="https://b.example.com/")
+    s2 = spec.model_copy(update={"base_urls": [b]})
+    assert s2.url_candidates(ep) == ["https://b.example.com/f.csv"]
+    assert s2.ordered_base_urls == (b,)
+    assert spec.url_candidates(ep) == ["https://a.example.com/f.csv"]
+
+    # Same id, different location: resolved on its own, not from the memo.
+    other = EndpointSpec(id="ep1", title="x", path="g.csv", format="csv")
+    assert spec.url_candidates(other) == ["https://a.example.com/g.csv"]
+
+
+@pytest.mark.parametrize(
+    ("loc", "expected"),
+    [
+        ({"path": "/a/b/routes.xml"}, "routes.xml"),
+        ({"url": "https://example.org/x/fares.csv"}, "fares.csv"),
+        ({"path": "dir/", "filename": "custom.bin"}, "custom.bin"),
+    ],
+)
+def test_endpoint_effective_filename(loc: dict, expected: str) -> None:
+    ep = EndpointSpec(id="ep1", title="t", format="other", **loc)
+
+    assert ep.effective_filename() == expected
+    assert ep.effective_filename() is ep.effective_filename()